@@ -5,82 +5,51 @@ A Model Context Protocol server that exposes Consul API functionality as tools f
 """
 
 import os
-import json
+import re
 import urllib.parse
 import asyncio
 import functools
+import inspect
 import base64
-from typing import Dict, List, Optional, Union, Any, Type, Literal
-from consul import Consul
-from consul.base import ACLPermissionDenied  # Import directly from consul.base
+from contextlib import asynccontextmanager
+import httpx
+import msgspec
+import orjson
+from typing import Dict, List, Optional, Union, Any, Type, Literal, AsyncIterator, Tuple
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, field_validator, model_validator, RootModel
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+
+# Input models are Pydantic (validation + JSON schema for the LLM); response
+# models are msgspec Structs, which encode trusted data without validation
 
 # Common Models
 class DatacenterParam(BaseModel):
     """Common parameter for datacenter specification."""
     dc: Optional[str] = Field(default=None, description="Datacenter to query")
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(msgspec.Struct):
     """Common error response model."""
     error: str
     success: Optional[bool] = False
 
-class SuccessResponse(BaseModel):
+class SuccessResponse(msgspec.Struct):
     """Common success response model."""
     success: bool
     error: Optional[str] = None
 
-# Datacenter Models
-class DatacenterList(BaseModel):
-    """List of datacenters."""
-    datacenters: List[str]
-
 # Node Models
 class NodeParams(DatacenterParam):
     """Parameters for node operations."""
     near: Optional[str] = Field(default=None, description="Sort by RTT from this node")
     filter: Optional[str] = Field(default=None, description="Filter expression")
 
-class NodeTaggedAddresses(BaseModel):
-    """Tagged addresses for a node."""
-    lan: Optional[str] = None
-    lan_ipv4: Optional[str] = None
-    wan: Optional[str] = None
-    wan_ipv4: Optional[str] = None
-
-class NodeMeta(BaseModel):
-    """Metadata for a node."""
-    consul_network_segment: Optional[str] = Field(default=None, alias="consul-network-segment")
-    consul_version: Optional[str] = Field(default=None, alias="consul-version")
-
-class Node(BaseModel):
-    """Node information."""
-    ID: str
-    Node: str
-    Address: str
-    Datacenter: Optional[str] = None
-    TaggedAddresses: Optional[NodeTaggedAddresses] = None
-    Meta: Optional[NodeMeta] = None
-    CreateIndex: Optional[int] = None
-    ModifyIndex: Optional[int] = None
-
-class NodeList(BaseModel):
-    """List of nodes."""
-    nodes: List[Node]
-
 # Service Models
 class ServiceParams(DatacenterParam):
     """Parameters for service operations."""
     pass
 
-class ServiceTagMap(RootModel[Dict[str, List[str]]]):
-    """Map of service name to tags."""
-    model_config = {
-        "arbitrary_types_allowed": True
-    }
-
 # Service Registration Models
 class ServiceRegistrationParams(DatacenterParam):
     """Parameters for service registration."""
@@ -88,18 +57,22 @@ class ServiceRegistrationParams(DatacenterParam):
     id: Optional[str] = Field(default=None, description="Service ID (defaults to name)")
     address: Optional[str] = Field(default=None, description="Service address")
     port: Optional[int] = Field(default=None, description="Service port")
-    tags: Optional[str] = Field(default=None, description="Comma-separated list of tags")
-    meta: Optional[str] = Field(default=None, description="JSON string with metadata key-value pairs")
+    tags: Optional[Tuple[str, ...]] = Field(default=None, description="Tags, as a list or comma-separated string")
+    meta: Optional[Union[str, dict, list]] = Field(default=None, description="JSON string with metadata key-value pairs")
     node: Optional[str] = Field(default=None, description="Node to register service on")
 
-    @field_validator('meta')
+    @field_validator('tags', mode='before')
+    def split_tags(cls, v):
+        """Split tags into a tuple of stripped names."""
+        return _split_names(v)
+
+    @field_validator('meta', mode='before')
     def validate_meta_json(cls, v):
-        """Validate that meta is valid JSON if provided."""
-        if v is not None:
-            import json
+        """Parse meta from JSON if provided as a string."""
+        if isinstance(v, str):
             try:
-                json.loads(v)
-            except json.JSONDecodeError:
+                return orjson.loads(v)
+            except orjson.JSONDecodeError:
                 raise ValueError("Invalid JSON in meta parameter")
         return v
 
@@ -109,6 +82,30 @@ class ServiceDeregistrationParams(DatacenterParam):
     service_id: str = Field(description="ID of the service to deregister")
     node: str = Field(description="Node the service is registered on")
 
+# Batch Service Models
+class ServiceBatchEntry(BaseModel):
+    """A single service in a batch registration."""
+    name: str = Field(description="Service name")
+    node: str = Field(description="Node to register service on")
+    id: Optional[str] = Field(default=None, description="Service ID (defaults to name)")
+    address: Optional[str] = Field(default=None, description="Service address")
+    port: Optional[int] = Field(default=None, description="Service port")
+    tags: Optional[List[str]] = Field(default=None, description="Service tags")
+    meta: Optional[Dict[str, str]] = Field(default=None, description="Metadata key-value pairs")
+
+class ServiceBatchParams(DatacenterParam):
+    """Parameters for batch service registration."""
+    services: List[ServiceBatchEntry] = Field(min_length=1, description="Services to register")
+
+class ServiceBatchDeregistrationEntry(BaseModel):
+    """A single service in a batch deregistration."""
+    service_id: str = Field(description="ID of the service to deregister")
+    node: str = Field(description="Node the service is registered on")
+
+class ServiceBatchDeregistrationParams(DatacenterParam):
+    """Parameters for batch service deregistration."""
+    services: List[ServiceBatchDeregistrationEntry] = Field(min_length=1, description="Services to deregister")
+
 # Health Check Models
 class HealthServiceParams(DatacenterParam):
     """Parameters for health service operations."""
@@ -121,19 +118,23 @@ class HealthServiceParams(DatacenterParam):
 class ACLTokenParams(BaseModel):
     """Parameters for ACL token creation."""
     description: Optional[str] = Field(default=None, description="Human readable description")
-    policies: Optional[str] = Field(default=None, description="Comma-separated policy names")
-    roles: Optional[str] = Field(default=None, description="Comma-separated role names")
-    service_identities: Optional[str] = Field(default=None, description="JSON service identities")
+    policies: Optional[Tuple[str, ...]] = Field(default=None, description="Policy names, as a list or comma-separated string")
+    roles: Optional[Tuple[str, ...]] = Field(default=None, description="Role names, as a list or comma-separated string")
+    service_identities: Optional[Union[str, dict, list]] = Field(default=None, description="JSON service identities")
     expires_after: Optional[str] = Field(default=None, description="Token expiration duration")
 
-    @field_validator('service_identities')
+    @field_validator('policies', 'roles', mode='before')
+    def split_names(cls, v):
+        """Split policy and role names into tuples of stripped names."""
+        return _split_names(v)
+
+    @field_validator('service_identities', mode='before')
     def validate_service_identities_json(cls, v):
-        """Validate that service_identities is valid JSON if provided."""
-        if v is not None:
-            import json
+        """Parse service_identities from JSON if provided as a string."""
+        if isinstance(v, str):
             try:
-                json.loads(v)
-            except json.JSONDecodeError:
+                return orjson.loads(v)
+            except orjson.JSONDecodeError:
                 raise ValueError("Invalid JSON in service_identities parameter")
         return v
 
@@ -149,16 +150,15 @@ class IntentionParams(BaseModel):
     destination_name: str = Field(description="Destination service name")
     action: Literal["allow", "deny"] = Field(description="Can be 'allow' or 'deny'")
     description: Optional[str] = Field(default=None, description="Human readable description")
-    meta: Optional[str] = Field(default=None, description="JSON metadata key-value pairs")
+    meta: Optional[Union[str, dict, list]] = Field(default=None, description="JSON metadata key-value pairs")
 
-    @field_validator('meta')
+    @field_validator('meta', mode='before')
     def validate_meta_json(cls, v):
-        """Validate that meta is valid JSON if provided."""
-        if v is not None:
-            import json
+        """Parse meta from JSON if provided as a string."""
+        if isinstance(v, str):
             try:
-                json.loads(v)
-            except json.JSONDecodeError:
+                return orjson.loads(v)
+            except orjson.JSONDecodeError:
                 raise ValueError("Invalid JSON in meta parameter")
         return v
 
@@ -181,87 +181,249 @@ class KVDeleteParams(DatacenterParam):
     key: str = Field(description="Key to delete")
     recurse: bool = Field(default=False, description="Delete all keys with given prefix")
 
-class KVEntry(BaseModel):
-    """KV store entry."""
-    CreateIndex: int
-    ModifyIndex: int
-    LockIndex: int
-    Key: str
-    Flags: int
-    Value: Optional[str] = None
-    Session: Optional[str] = None
+class KVGetManyParams(DatacenterParam):
+    """Parameters for reading several keys under one prefix."""
+    prefix: str = Field(description="Common prefix of the keys")
+    keys: List[str] = Field(min_length=1, description="Full key names to retrieve")
 
-class KVList(BaseModel):
-    """List of KV entries."""
-    entries: List[KVEntry]
+load_dotenv()
 
+# Server sessions currently sharing the HTTP client
+_lifespan_refs = 0
 
-load_dotenv()
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared HTTP client after the last session ends."""
+    global _lifespan_refs
+    _lifespan_refs += 1
+    try:
+        yield
+    finally:
+        _lifespan_refs -= 1
+        if _lifespan_refs == 0:
+            await close_http_client()
 
 # Initialize the MCP server
-mcp = FastMCP("consul-server")
+mcp = FastMCP("consul-server", lifespan=server_lifespan)
 
 # Consul client configuration
 CONSUL_URL = os.environ.get("CONSUL_URL")
 CONSUL_TOKEN = os.environ.get("CONSUL_TOKEN")
 
-# Parse CONSUL_URL to get host and port
-def get_consul_connection_info():
-    if not CONSUL_URL:
-        return "localhost", 8500  # Default Consul values
-    
-    parsed_url = urllib.parse.urlparse(CONSUL_URL)
-    host = parsed_url.hostname or "localhost"
-    port = parsed_url.port or 8500
-    
-    # Print connection info for debugging
-    print(f"Consul connection info: {host}:{port}")
+# Base URL of the shared client; endpoints are relative paths joined by httpx
+_BASE = (CONSUL_URL or "http://localhost:8500").rstrip("/")
+_ACL_TOKEN_PATH = "/v1/acl/token"
+_INTENTIONS_PATH = "/v1/connect/intentions"
+_QUERY_EXECUTE_PATH = "/v1/query/{}/execute"
+_TXN_PATH = "/v1/txn"
+
+# Serialized catalog responses keyed by (endpoint, query params), cleared on
+# every catalog write made by this server
+_catalog_cache = TTLCache(maxsize=256, ttl=float(os.environ.get("CONSUL_CATALOG_TTL", "5")))
+
+# Decoded KV trees keyed by (prefix, dc), cleared on every KV write made by this server
+_kv_tree_cache = TTLCache(maxsize=64, ttl=float(os.environ.get("CONSUL_KV_CACHE_TTL", "5")))
+
+# Default headers for every request, built once
+_HTTP_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept-Encoding": "gzip",
+    **({"X-Consul-Token": CONSUL_TOKEN} if CONSUL_TOKEN else {})
+}
+
+# Consul accepts at most this many operations in a single transaction
+_TXN_MAX_OPS = 64
+
+# Splits a comma-separated list into stripped items in a single pass
+_CSV_SPLIT = re.compile(r"\s*,\s*").split
+
+def _split_names(v):
+    """Normalize a comma-separated string or list of names to a tuple, dropping blanks."""
+    if v is None:
+        return v
+    if isinstance(v, str):
+        v = _CSV_SPLIT(v.strip())
+    return tuple(name.strip() for name in v if name.strip())
+
+# Helper to build query parameters, dropping unset (None/False) values
+def _qp(**kw):
+    """Return only the keyword arguments that were actually set."""
+    return {k: v for k, v in kw.items() if v is not None and v is not False}
+
+# In-flight read requests keyed by (tool name, bound arguments)
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+def singleflight(fn):
+    """Share one in-flight call between concurrent identical calls to a read-only tool."""
+    signature = inspect.signature(fn)
+    
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (fn.__name__, tuple(bound.arguments.items()))
+        future = _inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn(*args, **kwargs))
+            _inflight[key] = future
+            future.add_done_callback(lambda _: _inflight.pop(key, None))
+        # Shield so a cancelled caller does not cancel the call for the others
+        return await asyncio.shield(future)
+    
+    return wrapper
+
+# Shared client for all calls to the Consul HTTP API
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _get_http() -> httpx.AsyncClient:
+    """Return the shared httpx client, creating it on first use.
     
-    return host, port
+    Pooled connections belong to the event loop that opened them, so the
+    client is rebuilt if the tools are later driven from another loop.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client_loop is not loop:
+        _http_client_loop = loop
+        # HTTP/2 multiplexes concurrent requests over a single connection to the agent
+        _http_client = httpx.AsyncClient(
+            base_url=_BASE,
+            headers=_HTTP_HEADERS,
+            http2=True,
+            timeout=10.0
+        )
+    return _http_client
+
+async def close_http_client() -> None:
+    """Close the shared httpx client if it was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
-# Initialize Consul client
-def get_consul_client():
-    # Use the environment variables directly to ensure correct connection
-    if CONSUL_URL:
-        parsed_url = urllib.parse.urlparse(CONSUL_URL)
-        host = parsed_url.hostname
-        port = parsed_url.port or 8500
+def _bytes_to_text(data: bytes) -> Optional[str]:
+    """Decode KV value bytes as text, or return None if they are not valid UTF-8."""
+    # Most values are plain ASCII, which needs no exception handling to decode
+    if data.isascii():
+        return data.decode("ascii")
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+def _decode_kv_value(value: Optional[str]) -> Union[str, Dict[str, str], None]:
+    """Decode a base64 KV value from the HTTP API to a string, marking binary data that stays encoded."""
+    if not value:
+        return value
+    text = _bytes_to_text(base64.b64decode(value))
+    # Binary data stays base64 encoded so it isn't corrupted, marked as kv_get marks it
+    return {"Value": value, "_ValueEncoding": "base64"} if text is None else text
+
+def _decode_kv_entry(item: Dict[str, Any]) -> None:
+    """Decode a KV entry's Value in place, marking binary values that stay base64."""
+    value = item.get("Value")
+    if not value:
+        return
+    text = _bytes_to_text(base64.b64decode(value))
+    if text is None:
+        item["_ValueEncoding"] = "base64"
     else:
-        host, port = get_consul_connection_info()
+        item["Value"] = text
+
+async def _read_kv_tree(key: str, query_params: Dict[str, Any]) -> Optional[Tuple[str, bytearray]]:
+    """Stream a recursive KV read into a single buffer, or None if the prefix is missing.
+    
+    Returns the X-Consul-Index of the response along with the raw body.
+    """
+    buffer = bytearray()
+    async with _get_http().stream(
+        "GET",
+        f"/v1/kv/{urllib.parse.quote(key)}",
+        params={**query_params, "recurse": "true"}
+    ) as response:
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            buffer += chunk
+        index = response.headers.get("X-Consul-Index")
+    return index, buffer
+
+async def _run_txn(ops: List[Dict[str, Any]], query_params: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply operations through the transaction API, at most _TXN_MAX_OPS per request."""
+    results = []
+    errors = []
+    for start in range(0, len(ops), _TXN_MAX_OPS):
+        response = await _get_http().put(
+            _TXN_PATH,
+            json=ops[start:start + _TXN_MAX_OPS],
+            params=query_params
+        )
+        # 409 means the transaction was rolled back; the body lists the errors
+        if response.status_code != 409:
+            response.raise_for_status()
+        body = response.json()
+        results.extend(body.get("Results") or [])
+        for err in body.get("Errors") or []:
+            errors.append({**err, "OpIndex": start + err.get("OpIndex", 0)})
+    return {"success": not errors, "results": results, "errors": errors}
+
+async def _consul_get(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    """GET a Consul API path and return the decoded JSON body."""
+    response = await _get_http().get(path, params=params)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+async def _consul_write(method: str, path: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+    """Send a write request to Consul and return the decoded JSON body.
     
-    print(f"Creating Consul client with host={host}, port={port}")
-    return Consul(host=host, port=port, token=CONSUL_TOKEN)
+    Returns an ErrorResponse instead when Consul rejects the request.
+    """
+    response = await _get_http().request(method, path, params=params, **kwargs)
+    if response.status_code == 403:
+        return ErrorResponse(error="Permission denied: ACL permissions required for this operation")
+    if response.is_error:
+        return ErrorResponse(error=f"{response.status_code}: {response.text}")
+    return orjson.loads(response.content)
 
-# Helper to run synchronous functions in a thread pool
-async def run_sync(func):
-    """Run a synchronous function in a thread pool."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, func)
+# Responses are compact unless DEBUG=1, which pretty-prints them for reading
+_DEBUG = os.environ.get("DEBUG") == "1"
+_ORJSON_OPTS = orjson.OPT_INDENT_2 if _DEBUG else 0
 
 # Helper function to handle model to JSON string conversion
-def model_to_json(model: BaseModel) -> str:
-    """Convert a Pydantic model to a JSON string."""
-    return model.model_dump_json(indent=2)
+def model_to_json(model: msgspec.Struct) -> str:
+    """Convert a response Struct to a JSON string."""
+    data = msgspec.json.encode(model)
+    if _DEBUG:
+        data = msgspec.json.format(data, indent=2)
+    return data.decode()
+
+# Helper function to handle plain data to JSON string conversion
+def to_json(data: Any) -> str:
+    """Convert plain Python data to a JSON string."""
+    return orjson.dumps(data, option=_ORJSON_OPTS).decode()
 
 # 1. List Datacenters
 @mcp.tool()
+@singleflight
 async def list_datacenters() -> str:
     """
     Returns a list of all known datacenters sorted by estimated median round trip time.
     """
-    client = get_consul_client()
-    
-    # Make this a regular function, not an async function
-    def get_datacenters():
-        return client.catalog.datacenters()
-    
-    datacenters = await run_sync(get_datacenters)
-    # Create and return a Pydantic model
-    response = DatacenterList(datacenters=datacenters)
-    return model_to_json(response)
+    cache_key = ("datacenters", frozenset())
+    cached = _catalog_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    datacenters = await _consul_get("/v1/catalog/datacenters")
+    result = to_json({"datacenters": datacenters})
+    _catalog_cache[cache_key] = result
+    return result
 
 # 2. List Nodes
 @mcp.tool()
+@singleflight
 async def list_nodes(
     dc: Optional[str] = None,
     near: Optional[str] = None,
@@ -273,39 +435,25 @@ async def list_nodes(
     # Create and validate the input parameters model
     params = NodeParams(dc=dc, near=near, filter=filter)
     
-    client = get_consul_client()
-    
     # Build query parameters
-    query_params = {}
-    if params.dc:
-        query_params["dc"] = params.dc
-    if params.near:
-        query_params["near"] = params.near
-    # Note: Remove filter param as the Consul API doesn't support it
-    
-    def get_nodes():
-        return client.catalog.nodes(**query_params)
-    
-    index, nodes = await run_sync(get_nodes)
-    
-    # Apply manual filtering if filter parameter was provided
-    if params.filter:
-        # Implement manual filtering logic here if needed
-        # For now, just add a warning
-        print(f"Warning: Filter parameter '{params.filter}' not supported by underlying API, results not filtered")
-    
-    # Create node models from the response
-    node_list = []
-    for node in nodes:
-        # Convert each node to a Node model
-        node_list.append(Node(**node))
-    
-    # Create and return the node list response
-    response = NodeList(nodes=node_list)
-    return model_to_json(response)
+    query_params = _qp(dc=params.dc, near=params.near, filter=params.filter)
+    
+    cache_key = ("nodes", frozenset(query_params.items()))
+    cached = _catalog_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    nodes = await _consul_get("/v1/catalog/nodes", params=query_params)
+    
+    # Consul's node objects are passed through as-is rather than rebuilt
+    # as models just to be serialized again
+    result = to_json({"nodes": nodes})
+    _catalog_cache[cache_key] = result
+    return result
 
 # 3. List Services
 @mcp.tool()
+@singleflight
 async def list_services(dc: Optional[str] = None) -> str:
     """
     Returns a list of services registered in the catalog.
@@ -316,21 +464,19 @@ async def list_services(dc: Optional[str] = None) -> str:
     # Create and validate the input parameters model
     params = ServiceParams(dc=dc)
     
-    client = get_consul_client()
-    
-    query_params = {}
-    if params.dc:
-        query_params["dc"] = params.dc
+    query_params = _qp(dc=params.dc)
     
-    # Change this to regular function
-    def get_services():
-        return client.catalog.services(**query_params)
+    cache_key = ("services", frozenset(query_params.items()))
+    cached = _catalog_cache.get(cache_key)
+    if cached is not None:
+        return cached
     
-    index, services = await run_sync(get_services)
+    services = await _consul_get("/v1/catalog/services", params=query_params)
     
-    # Create response model (services is already a dict of service name -> tags)
-    response = ServiceTagMap(root=services)
-    return model_to_json(response)
+    # services is already a dict of service name -> tags
+    result = to_json(services)
+    _catalog_cache[cache_key] = result
+    return result
 
 # 4. Register Service
 @mcp.tool()
@@ -339,7 +485,7 @@ async def register_service(
     id: Optional[str] = None,
     address: Optional[str] = None,
     port: Optional[int] = None,
-    tags: Optional[str] = None,
+    tags: Optional[Union[str, List[str]]] = None,
     meta: Optional[str] = None,
     dc: Optional[str] = None,
     node: Optional[str] = None  # Adding node parameter which appears to be required
@@ -352,7 +498,7 @@ async def register_service(
         id: Service ID (if not provided, defaults to name)
         address: Service address (defaults to node address)
         port: Service port
-        tags: Comma-separated list of tags for the service
+        tags: List of tags, or a comma-separated string of tags, for the service
         meta: JSON string with metadata key-value pairs
         dc: Datacenter to register in
         node: Node to register service on (required)
@@ -363,14 +509,18 @@ async def register_service(
         tags=tags, meta=meta, dc=dc, node=node
     )
     
-    client = get_consul_client()
+    # Reject bad input before making any request to Consul
+    if not params.name.strip():
+        error = ErrorResponse(error="Service name must not be empty")
+        return model_to_json(error)
     
     # Get nodes if node not provided
     if not params.node:
-        def get_nodes():
-            return client.catalog.nodes()
-        
-        index, nodes = await run_sync(get_nodes)
+        try:
+            nodes = await _consul_get("/v1/catalog/nodes")
+        except Exception as e:
+            error = ErrorResponse(error=str(e))
+            return model_to_json(error)
         if not nodes:
             error = ErrorResponse(error="No nodes found, cannot register service")
             return model_to_json(error)
@@ -378,40 +528,26 @@ async def register_service(
         # Use the first node
         params.node = nodes[0]['Node']
     
-    # Build service definition
-    service_def = {
-        "node": params.node,
-        "service": params.name
-    }
-    
-    if params.id:
-        service_def["service"] = params.id  # Changed from service_id to service
-    if params.address:
-        service_def["address"] = params.address
-    if params.port:
-        service_def["port"] = params.port
-    if params.tags:
-        service_def["tags"] = [tag.strip() for tag in params.tags.split(",")]
-    if params.meta:
-        try:
-            service_def["meta"] = json.loads(params.meta)
-        except json.JSONDecodeError:
-            error = ErrorResponse(error="Invalid JSON in meta parameter")
-            return model_to_json(error)
-    
-    if params.dc:
-        service_def["dc"] = params.dc
+    # Build service definition, leaving out unset fields
+    service_def = _qp(
+        Service=params.name, ID=params.id, Address=params.address,
+        Port=params.port, Tags=params.tags, Meta=params.meta
+    )
     
-    def do_register():
-        return client.catalog.register(**service_def)
+    # The node already exists, so only the service entry is written
+    registration = _qp(Node=params.node, SkipNodeUpdate=True, Service=service_def, Datacenter=params.dc)
     
     try:
-        result = await run_sync(do_register)
-        response = SuccessResponse(success=result)
-        return model_to_json(response)
+        result = await _consul_write("PUT", "/v1/catalog/register", json=registration)
     except Exception as e:
         error = ErrorResponse(error=str(e))
         return model_to_json(error)
+    if isinstance(result, ErrorResponse):
+        return model_to_json(result)
+    
+    _catalog_cache.clear()
+    response = SuccessResponse(success=result)
+    return model_to_json(response)
 
 # 5. Deregister Service
 @mcp.tool()
@@ -434,30 +570,27 @@ async def deregister_service(
     if not params.node:
         error = ErrorResponse(error="Node parameter is required for deregistration")
         return model_to_json(error)
+    if not params.service_id:
+        error = ErrorResponse(error="Service ID is required for deregistration")
+        return model_to_json(error)
     
-    client = get_consul_client()
-    
-    deregister_params = {
-        "node": params.node,
-        "service_id": params.service_id
-    }
-    
-    if params.dc:
-        deregister_params["dc"] = params.dc
-    
-    def do_deregister():
-        return client.catalog.deregister(**deregister_params)
+    deregistration = _qp(Node=params.node, ServiceID=params.service_id, Datacenter=params.dc)
     
     try:
-        result = await run_sync(do_deregister)
-        response = SuccessResponse(success=result)
-        return model_to_json(response)
+        result = await _consul_write("PUT", "/v1/catalog/deregister", json=deregistration)
     except Exception as e:
         error = ErrorResponse(error=str(e))
         return model_to_json(error)
+    if isinstance(result, ErrorResponse):
+        return model_to_json(result)
+    
+    _catalog_cache.clear()
+    response = SuccessResponse(success=result)
+    return model_to_json(response)
 
 # 6. Health Checking
 @mcp.tool()
+@singleflight
 async def health_service(
     service: str,
     dc: Optional[str] = None,
@@ -480,35 +613,22 @@ async def health_service(
         service=service, dc=dc, passing=passing, near=near, filter=filter
     )
     
-    client = get_consul_client()
+    query_params = _qp(dc=params.dc, passing=params.passing, near=params.near, filter=params.filter)
     
-    query_params = {}
-    if params.dc:
-        query_params["dc"] = params.dc
-    if params.passing:
-        query_params["passing"] = params.passing
-    if params.near:
-        query_params["near"] = params.near
-    # Remove filter param as it's not supported
-    
-    def get_health():
-        return client.health.service(params.service, **query_params)
-    
-    index, health_data = await run_sync(get_health)
-    
-    # Apply manual filtering if filter parameter was provided
-    if params.filter:
-        print(f"Warning: Filter parameter '{params.filter}' not supported by underlying API, results not filtered")
+    health_data = await _consul_get(
+        f"/v1/health/service/{urllib.parse.quote(params.service)}",
+        params=query_params
+    )
     
     # Return the health data as JSON (already has proper structure)
-    return json.dumps(health_data, indent=2)
+    return to_json(health_data)
 
 # 7. Create ACL Token
 @mcp.tool()
 async def create_acl_token(
     description: Optional[str] = None,
-    policies: Optional[str] = None,
-    roles: Optional[str] = None,
+    policies: Optional[Union[str, List[str]]] = None,
+    roles: Optional[Union[str, List[str]]] = None,
     service_identities: Optional[str] = None,
     expires_after: Optional[str] = None
 ) -> str:
@@ -517,8 +637,8 @@ async def create_acl_token(
     
     Args:
         description: Human readable description of the token
-        policies: Comma-separated list of policy names to associate with the token
-        roles: Comma-separated list of role names to associate with the token
+        policies: List, or comma-separated string, of policy names to associate with the token
+        roles: List, or comma-separated string, of role names to associate with the token
         service_identities: JSON string with service identity definitions
         expires_after: Duration after which the token expires (e.g., "24h")
     """
@@ -531,53 +651,35 @@ async def create_acl_token(
         expires_after=expires_after
     )
     
-    # The Python consul package may not fully support newer ACL APIs
-    # Falling back to HTTP request method for this one
-    import httpx
-    
-    url = f"{CONSUL_URL}/v1/acl/token"
-    headers = {"Content-Type": "application/json"}
-    if CONSUL_TOKEN:
-        headers["X-Consul-Token"] = CONSUL_TOKEN
-    
     token_def = {}
     
     if params.description:
         token_def["Description"] = params.description
     
     if params.policies:
-        token_def["Policies"] = [{"Name": policy.strip()} for policy in params.policies.split(",")]
+        token_def["Policies"] = [{"Name": policy} for policy in params.policies]
     
     if params.roles:
-        token_def["Roles"] = [{"Name": role.strip()} for role in params.roles.split(",")]
+        token_def["Roles"] = [{"Name": role} for role in params.roles]
     
-    if params.service_identities:
-        try:
-            token_def["ServiceIdentities"] = json.loads(params.service_identities)
-        except json.JSONDecodeError:
-            error = ErrorResponse(error="Invalid JSON in service_identities parameter")
-            return model_to_json(error)
+    if params.service_identities is not None:
+        token_def["ServiceIdentities"] = params.service_identities
     
     if params.expires_after:
         token_def["ExpirationTTL"] = params.expires_after
     
-    async with httpx.AsyncClient() as http_client:
-        response = await http_client.put(
-            url,
-            json=token_def,
-            headers=headers
-        )
-        try:
-            response.raise_for_status()
-            return json.dumps(response.json(), indent=2)
-        except httpx.HTTPStatusError as e:
-            error = {
-                "error": True,
-                "status_code": e.response.status_code,
-                "message": str(e),
-                "details": e.response.text
-            }
-            return json.dumps(error, indent=2)
+    response = await _get_http().put(_ACL_TOKEN_PATH, json=token_def)
+    try:
+        response.raise_for_status()
+        return to_json(response.json())
+    except httpx.HTTPStatusError as e:
+        error = {
+            "error": True,
+            "status_code": e.response.status_code,
+            "message": str(e),
+            "details": e.response.text
+        }
+        return to_json(error)
 
 # 8. Query Prepared Queries
 @mcp.tool()
@@ -595,43 +697,32 @@ async def execute_prepared_query(
     # Create and validate the input parameters model
     params = PreparedQueryParams(query_id=query_id, dc=dc)
     
-    # The Python consul package may not support prepared queries API
-    # Falling back to HTTP request method for this one
-    import httpx
-    
-    url = f"{CONSUL_URL}/v1/query/{params.query_id}/execute"
-    headers = {"Content-Type": "application/json"}
-    if CONSUL_TOKEN:
-        headers["X-Consul-Token"] = CONSUL_TOKEN
+    if not params.query_id.strip():
+        error = ErrorResponse(error="Query ID must not be empty")
+        return model_to_json(error)
     
-    query_params = {}
-    if params.dc:
-        query_params["dc"] = params.dc
+    path = _QUERY_EXECUTE_PATH.format(urllib.parse.quote(params.query_id, safe=""))
+    query_params = _qp(dc=params.dc)
     
-    async with httpx.AsyncClient() as http_client:
-        response = await http_client.get(
-            url,
-            params=query_params,
-            headers=headers
-        )
-        try:
-            response.raise_for_status()
-            return json.dumps(response.json(), indent=2)
-        except httpx.HTTPStatusError as e:
-            error = {
-                "error": True,
-                "status_code": e.response.status_code,
-                "message": str(e),
-                "details": e.response.text
-            }
-            return json.dumps(error, indent=2)
+    response = await _get_http().get(path, params=query_params)
+    try:
+        response.raise_for_status()
+        return to_json(response.json())
+    except httpx.HTTPStatusError as e:
+        error = {
+            "error": True,
+            "status_code": e.response.status_code,
+            "message": str(e),
+            "details": e.response.text
+        }
+        return to_json(error)
 
 # 9. Service Mesh Intention
 @mcp.tool()
 async def create_intention(
     source_name: str,
     destination_name: str,
-    action: str,
+    action: Literal["allow", "deny"],
     description: Optional[str] = None,
     meta: Optional[str] = None
 ) -> str:
@@ -645,28 +736,22 @@ async def create_intention(
         description: Human readable description
         meta: JSON string with metadata key-value pairs
     """
-    # Validate action before creating model
-    if action not in ["allow", "deny"]:
-        error = ErrorResponse(error="Action must be either 'allow' or 'deny'")
-        return model_to_json(error)
-    
     # Create and validate the input parameters model
-    params = IntentionParams(
-        source_name=source_name,
-        destination_name=destination_name,
-        action=action,
-        description=description,
-        meta=meta
-    )
-    
-    # The Python consul package may not support connect intentions API
-    # Falling back to HTTP request method for this one
-    import httpx
+    try:
+        params = IntentionParams(
+            source_name=source_name,
+            destination_name=destination_name,
+            action=action,
+            description=description,
+            meta=meta
+        )
+    except ValidationError as e:
+        error = ErrorResponse(error=str(e))
+        return model_to_json(error)
     
-    url = f"{CONSUL_URL}/v1/connect/intentions"
-    headers = {"Content-Type": "application/json"}
-    if CONSUL_TOKEN:
-        headers["X-Consul-Token"] = CONSUL_TOKEN
+    if not params.source_name.strip() or not params.destination_name.strip():
+        error = ErrorResponse(error="Source and destination service names must not be empty")
+        return model_to_json(error)
     
     intention_def = {
         "SourceName": params.source_name,
@@ -677,33 +762,25 @@ async def create_intention(
     if params.description:
         intention_def["Description"] = params.description
     
-    if params.meta:
-        try:
-            intention_def["Meta"] = json.loads(params.meta)
-        except json.JSONDecodeError:
-            error = ErrorResponse(error="Invalid JSON in meta parameter")
-            return model_to_json(error)
+    if params.meta is not None:
+        intention_def["Meta"] = params.meta
     
-    async with httpx.AsyncClient() as http_client:
-        response = await http_client.post(
-            url,
-            json=intention_def,
-            headers=headers
-        )
-        try:
-            response.raise_for_status()
-            return json.dumps(response.json(), indent=2)
-        except httpx.HTTPStatusError as e:
-            error = {
-                "error": True,
-                "status_code": e.response.status_code,
-                "message": str(e),
-                "details": e.response.text
-            }
-            return json.dumps(error, indent=2)
+    response = await _get_http().post(_INTENTIONS_PATH, json=intention_def)
+    try:
+        response.raise_for_status()
+        return to_json(response.json())
+    except httpx.HTTPStatusError as e:
+        error = {
+            "error": True,
+            "status_code": e.response.status_code,
+            "message": str(e),
+            "details": e.response.text
+        }
+        return to_json(error)
 
 # 10. KV Store Operations - Get
 @mcp.tool()
+@singleflight
 async def kv_get(
     key: str,
     dc: Optional[str] = None,
@@ -712,54 +789,64 @@ async def kv_get(
 ) -> str:
     """
     Retrieves a key-value pair from the KV store.
+    
+    Values that are not valid UTF-8 are returned base64 encoded; in JSON
+    responses such entries carry "_ValueEncoding": "base64".
     """
     # Create and validate the input parameters model
     params = KVGetParams(key=key, dc=dc, recurse=recurse, raw=raw)
     
-    client = get_consul_client()
-    
-    query_params = {}
-    if params.dc:
-        query_params["dc"] = params.dc
-    
-    def do_get():
-        return client.kv.get(params.key, recurse=params.recurse, **query_params)
+    query_params = _qp(dc=params.dc)
     
     try:
-        index, value = await run_sync(do_get)
+        if params.recurse:
+            # Large trees are read straight off the wire and parsed once
+            tree = await _read_kv_tree(params.key, query_params)
+            if tree is None:
+                error = ErrorResponse(error="Key not found")
+                return model_to_json(error)
+            
+            index, body = tree
+            if params.raw:
+                # For recursive operations, just return the full structure
+                return body.decode("utf-8")
+            
+            value = orjson.loads(body)
+            for item in value:
+                # Value is base64 encoded on the wire, decode it
+                _decode_kv_entry(item)
+            return to_json(value)
+        
+        if params.raw:
+            # For single key with raw, let Consul return just the value bytes
+            response = await _get_http().get(
+                f"/v1/kv/{urllib.parse.quote(params.key)}",
+                params={**query_params, "raw": "true"}
+            )
+            if response.status_code == 404:
+                error = ErrorResponse(error="Key not found")
+                return model_to_json(error)
+            response.raise_for_status()
+            # Binary values are returned base64 encoded rather than as mangled text
+            text = _bytes_to_text(response.content)
+            return text if text is not None else base64.b64encode(response.content).decode("ascii")
         
-        if value is None:
+        response = await _get_http().get(
+            f"/v1/kv/{urllib.parse.quote(params.key)}",
+            params=query_params
+        )
+        if response.status_code == 404:
             error = ErrorResponse(error="Key not found")
             return model_to_json(error)
+        response.raise_for_status()
         
-        if params.raw:
-            if params.recurse:
-                # For recursive operations, just return the full structure
-                return json.dumps(value, indent=2)
-            else:
-                # For single key with raw, return just the value
-                return value["Value"].decode("utf-8") if value["Value"] else ""
-        else:
-            # Process values for non-recursive responses to decode base64
-            if not params.recurse:
-                if isinstance(value, dict) and "Value" in value and value["Value"]:
-                    try:
-                        # Value is base64 encoded, decode it
-                        value["Value"] = value["Value"].decode("utf-8")
-                    except (UnicodeDecodeError, AttributeError):
-                        # If we can't decode as string, leave it as is
-                        pass
-            else:
-                # Handle recursive results (list of dicts)
-                for item in value:
-                    if "Value" in item and item["Value"]:
-                        try:
-                            item["Value"] = item["Value"].decode("utf-8")
-                        except (UnicodeDecodeError, AttributeError):
-                            pass
-                            
-            # Normal get operation
-            return json.dumps(value, indent=2)
+        # A single key comes back as a one-entry list
+        value = orjson.loads(response.content)[0]
+        # Value is base64 encoded on the wire, decode it
+        _decode_kv_entry(value)
+        
+        # Normal get operation
+        return to_json(value)
     except Exception as e:
         error = ErrorResponse(error=str(e))
         return model_to_json(error)
@@ -786,32 +873,24 @@ async def kv_put(
     # Create and validate the input parameters model
     params = KVPutParams(key=key, value=value, dc=dc, flags=flags, cas=cas)
     
-    client = get_consul_client()
+    query_params = _qp(dc=params.dc, flags=params.flags, cas=params.cas)
     
-    query_params = {}
-    if params.dc:
-        query_params["dc"] = params.dc
-    if params.flags is not None:
-        query_params["flags"] = params.flags
-    if params.cas is not None:
-        query_params["cas"] = params.cas
-    
-    def do_put():
-        try:
-            return client.kv.put(params.key, params.value, **query_params)
-        except ACLPermissionDenied:  # Fixed: use imported ACLPermissionDenied
-            return {"acl_error": "Permission denied: ACL permissions required for KV write operations"}
-        except Exception as e:
-            return {"error": str(e)}
-    
-    result = await run_sync(do_put)
+    try:
+        result = await _consul_write(
+            "PUT",
+            f"/v1/kv/{urllib.parse.quote(params.key)}",
+            params=query_params,
+            content=params.value.encode("utf-8")
+        )
+    except Exception as e:
+        error = ErrorResponse(error=str(e))
+        return model_to_json(error)
     
     # Check if we got an error
-    if isinstance(result, dict) and ("acl_error" in result or "error" in result):
-        error_msg = result.get("acl_error", result.get("error", "Unknown error"))
-        error = ErrorResponse(error=error_msg)
-        return model_to_json(error)
+    if isinstance(result, ErrorResponse):
+        return model_to_json(result)
     
+    _kv_tree_cache.clear()
     response = SuccessResponse(success=result)
     return model_to_json(response)
 
@@ -828,29 +907,162 @@ async def kv_delete(
     # Create and validate the input parameters model
     params = KVDeleteParams(key=key, dc=dc, recurse=recurse)
     
-    client = get_consul_client()
+    query_params = _qp(dc=params.dc, recurse=params.recurse)
+    
+    try:
+        result = await _consul_write(
+            "DELETE",
+            f"/v1/kv/{urllib.parse.quote(params.key)}",
+            params=query_params
+        )
+    except Exception as e:
+        error = ErrorResponse(error=str(e))
+        return model_to_json(error)
     
-    query_params = {}
-    if params.dc:
-        query_params["dc"] = params.dc
+    # Check if we got an error
+    if isinstance(result, ErrorResponse):
+        return model_to_json(result)
     
-    def do_delete():
-        try:
-            return client.kv.delete(params.key, recurse=params.recurse, **query_params)
-        except ACLPermissionDenied:  # Fixed: use imported ACLPermissionDenied
-            return {"acl_error": "Permission denied: ACL permissions required for KV write operations"}
-        except Exception as e:
-            return {"error": str(e)}
+    _kv_tree_cache.clear()
+    response = SuccessResponse(success=result)
+    return model_to_json(response)
+
+# 13. Batch Register Services
+@mcp.tool()
+async def register_services_batch(
+    services: List[Dict[str, Any]],
+    dc: Optional[str] = None
+) -> str:
+    """
+    Registers many services with the catalog using the transaction API.
     
-    result = await run_sync(do_delete)
+    Args:
+        services: List of services, each with name, node and optional id, address, port, tags (list) and meta (object)
+        dc: Datacenter to register in
     
-    # Check if we got an error
-    if isinstance(result, dict) and ("acl_error" in result or "error" in result):
-        error_msg = result.get("acl_error", result.get("error", "Unknown error"))
-        error = ErrorResponse(error=error_msg)
+    Services are sent in transactions of up to 64 operations. Each transaction
+    is atomic, but a batch larger than 64 services is not.
+    """
+    # Create and validate the input parameters model
+    params = ServiceBatchParams(services=services, dc=dc)
+    
+    ops = [
+        {"Service": {"Verb": "set", "Node": entry.node, "Service": _qp(
+            Service=entry.name, ID=entry.id, Address=entry.address,
+            Port=entry.port, Tags=entry.tags, Meta=entry.meta
+        )}}
+        for entry in params.services
+    ]
+    
+    try:
+        result = await _run_txn(ops, _qp(dc=params.dc))
+        _catalog_cache.clear()
+        return to_json(result)
+    except httpx.HTTPStatusError as e:
+        error = {
+            "error": True,
+            "status_code": e.response.status_code,
+            "message": str(e),
+            "details": e.response.text
+        }
+        return to_json(error)
+
+# 14. Batch Deregister Services
+@mcp.tool()
+async def deregister_services_batch(
+    services: List[Dict[str, Any]],
+    dc: Optional[str] = None
+) -> str:
+    """
+    Deregisters many services from the catalog using the transaction API.
+    
+    Args:
+        services: List of services, each with service_id and node
+        dc: Datacenter the services are registered in
+    
+    Services are sent in transactions of up to 64 operations. Each transaction
+    is atomic, but a batch larger than 64 services is not.
+    """
+    # Create and validate the input parameters model
+    params = ServiceBatchDeregistrationParams(services=services, dc=dc)
+    
+    ops = [
+        {"Service": {"Verb": "delete", "Node": entry.node, "Service": {"ID": entry.service_id}}}
+        for entry in params.services
+    ]
+    
+    try:
+        result = await _run_txn(ops, _qp(dc=params.dc))
+        _catalog_cache.clear()
+        return to_json(result)
+    except httpx.HTTPStatusError as e:
+        error = {
+            "error": True,
+            "status_code": e.response.status_code,
+            "message": str(e),
+            "details": e.response.text
+        }
+        return to_json(error)
+
+# 15. KV Store Operations - Get Many
+@mcp.tool()
+async def kv_get_many(
+    prefix: str,
+    keys: List[str],
+    dc: Optional[str] = None
+) -> str:
+    """
+    Retrieves several keys that share a prefix with a single recursive read.
+    
+    Args:
+        prefix: Common prefix of the keys
+        keys: Full key names to retrieve
+        dc: Datacenter to query
+    
+    Values that are not valid UTF-8 are returned as
+    {"Value": <base64>, "_ValueEncoding": "base64"} instead of a string.
+    
+    The decoded prefix is cached for a few seconds (CONSUL_KV_CACHE_TTL), so
+    repeated lookups under the same prefix do not go back to Consul.
+    """
+    # Create and validate the input parameters model
+    params = KVGetManyParams(prefix=prefix, keys=keys, dc=dc)
+    
+    outside = [k for k in params.keys if not k.startswith(params.prefix)]
+    if outside:
+        error = ErrorResponse(error=f"Keys not under prefix '{params.prefix}': {', '.join(outside)}")
         return model_to_json(error)
     
-    response = SuccessResponse(success=result)
+    cache_key = (params.prefix, params.dc)
+    cached = _kv_tree_cache.get(cache_key)
+    if cached is None:
+        try:
+            tree = await _read_kv_tree(params.prefix, _qp(dc=params.dc))
+        except Exception as e:
+            error = ErrorResponse(error=str(e))
+            return model_to_json(error)
+        
+        if tree is None:
+            cached = (None, {})
+        else:
+            index, body = tree
+            cached = (index, {item["Key"]: _decode_kv_value(item.get("Value")) for item in orjson.loads(body)})
+        _kv_tree_cache[cache_key] = cached
+    
+    index, tree_values = cached
+    values = {k: tree_values[k] for k in params.keys if k in tree_values}
+    missing = [k for k in params.keys if k not in tree_values]
+    return to_json({"Index": index, "values": values, "missing": missing})
+
+# 16. Clear Cached Reads
+@mcp.tool()
+async def bust_cache() -> str:
+    """
+    Clears cached catalog and KV reads so the next call goes to Consul.
+    """
+    _catalog_cache.clear()
+    _kv_tree_cache.clear()
+    response = SuccessResponse(success=True)
     return model_to_json(response)
 
 # Main entry point
@@ -6,22 +6,53 @@ This server provides tools for interacting with the Datadog API through the Mode
 """
 
 import os
-import json
+import asyncio
+import logging
 import time
-import requests
-from typing import Dict, List, Any, Optional, Union
-from urllib.parse import urljoin
-from mcp.server.fastmcp import FastMCP, Context
+import gzip
+import zlib
+import hashlib
+import inspect
+import functools
+import importlib
+import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Any, NamedTuple, Optional, Union
+from urllib.parse import quote, urlencode
+from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, Json, field_validator
-from datadog_api_client import ApiClient, Configuration
-from datadog_api_client.v1.api.metrics_api import MetricsApi
-from datadog_api_client.v1.api.monitors_api import MonitorsApi
-from datadog_api_client.v1.api.events_api import EventsApi
-from datadog_api_client.v1.api.dashboards_api import DashboardsApi
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from datadog_api_client import AsyncApiClient, Configuration
+from datadog_api_client.exceptions import (
+    ApiException,
+    ForbiddenException,
+    NotFoundException,
+    ServiceException,
+    UnauthorizedException,
+)
+from datadog_api_client.rest import RETRY_AFTER_STATUS_CODES, RETRY_ALLOWED_METHODS
 from datadog_api_client.v1.model.metrics_payload import MetricsPayload
+from datadog_api_client.v1.model.metric_content_encoding import MetricContentEncoding
 from datadog_api_client.v1.model.series import Series
-from datadog_api_client.v1.model.point import Point
+from datadog_api_client.v1.model.event_create_request import EventCreateRequest
+from datadog_api_client.v1.model.event_alert_type import EventAlertType
+from datadog_api_client.v1.model.event_priority import EventPriority
+from datadog_api_client.v1.model.monitor import Monitor
+from datadog_api_client.v1.model.monitor_type import MonitorType
+from datadog_api_client.v1.model.dashboard import Dashboard
+from datadog_api_client.v1.model.dashboard_layout_type import DashboardLayoutType
+from datadog_api_client.v2.model.logs_list_request import LogsListRequest
+from datadog_api_client.v2.model.logs_list_request_page import LogsListRequestPage
+from datadog_api_client.v2.model.logs_query_filter import LogsQueryFilter
+
+# SDK enum values by their string form, built once instead of per call
+_EVENT_ALERT_TYPES = {v: EventAlertType(v) for v in EventAlertType.allowed_values}
+_EVENT_PRIORITIES = {v: EventPriority(v) for v in EventPriority.allowed_values}
+_MONITOR_TYPES = {v: MonitorType(v) for v in MonitorType.allowed_values}
+_LAYOUT_TYPES = {v: DashboardLayoutType(v) for v in DashboardLayoutType.allowed_values}
 
 # Pydantic Models for API validation
 class DatadogResponse(BaseModel):
@@ -38,31 +69,49 @@ class PaginationParams(BaseModel):
     page_size: int = Field(default=100, description="Maximum number of results to return")
     page: int = Field(default=1, description="Page number to retrieve")
 
-class JSONString(BaseModel):
-    """Model for validating JSON strings."""
-    json_str: Json = Field(description="JSON string")
-    
-    def get_parsed_json(self) -> dict:
-        """Return the parsed JSON as a Python dictionary."""
-        return json.loads(self.json_str)
+# Tool argument models are validated once and never mutated
+_ARGS_CONFIG = ConfigDict(extra="ignore", frozen=True)
 
 # Models for Metrics API
 class MetricSubmit(BaseModel):
     """Model for submitting a metric."""
+    model_config = _ARGS_CONFIG
     metric_name: str = Field(description="Name of the metric")
     value: float = Field(description="Value of the metric")
     timestamp: Optional[int] = Field(default=None, description="Timestamp for the metric point")
     tags: Optional[List[str]] = Field(default=None, description="List of tags for the metric")
     
+@functools.lru_cache(maxsize=1024)
+def _epoch(value: Union[int, str]) -> int:
+    """Parse an epoch timestamp, accepting only 9 to 19 ASCII digits."""
+    text = str(value)
+    if not (text.isascii() and text.isdigit() and 9 <= len(text) <= 19):
+        raise ValueError(f"Invalid epoch timestamp: {value!r}")
+    return int(text)
+
 class MetricQuery(BaseModel):
     """Model for querying metrics."""
+    model_config = _ARGS_CONFIG
     query: str = Field(description="Metric query string")
     from_time: int = Field(description="Start time in seconds since epoch")
     to_time: int = Field(description="End time in seconds since epoch")
+    fields: Optional[List[str]] = Field(default=None, description="Series keys to keep in the result")
+    
+    @field_validator('from_time', 'to_time', mode='before')
+    def validate_epoch(cls, v):
+        return _epoch(v)
 
 # Models for Events API
+_EVENT_ALERT_TYPE_NAMES = ("info", "warning", "error", "success")
+_EVENT_PRIORITY_NAMES = ("normal", "low")
+_VALID_EVENT_ALERT_TYPES = frozenset(_EVENT_ALERT_TYPE_NAMES)
+_VALID_EVENT_PRIORITIES = frozenset(_EVENT_PRIORITY_NAMES)
+_ALERT_TYPE_ERROR = f"Alert type must be one of {list(_EVENT_ALERT_TYPE_NAMES)}"
+_PRIORITY_ERROR = f"Priority must be one of {list(_EVENT_PRIORITY_NAMES)}"
+
 class EventCreate(BaseModel):
     """Model for creating an event."""
+    model_config = _ARGS_CONFIG
     title: str = Field(description="Title of the event")
     text: str = Field(description="Text of the event")
     tags: Optional[List[str]] = Field(default=None, description="List of tags for the event")
@@ -71,21 +120,24 @@ class EventCreate(BaseModel):
     
     @field_validator('alert_type')
     def validate_alert_type(cls, v):
-        valid_types = ["info", "warning", "error", "success"]
-        if v not in valid_types:
-            raise ValueError(f"Alert type must be one of {valid_types}")
+        if v not in _VALID_EVENT_ALERT_TYPES:
+            raise ValueError(_ALERT_TYPE_ERROR)
         return v
     
     @field_validator('priority')
     def validate_priority(cls, v):
-        valid_priorities = ["normal", "low"]
-        if v not in valid_priorities:
-            raise ValueError(f"Priority must be one of {valid_priorities}")
+        if v not in _VALID_EVENT_PRIORITIES:
+            raise ValueError(_PRIORITY_ERROR)
         return v
 
 # Models for Monitors API
+_MONITOR_TYPE_NAMES = ("metric alert", "service check", "event alert", "query alert", "composite")
+_VALID_MONITOR_TYPES = frozenset(_MONITOR_TYPE_NAMES)
+_MONITOR_TYPE_ERROR = f"Monitor type must be one of {list(_MONITOR_TYPE_NAMES)}"
+
 class MonitorCreate(BaseModel):
     """Model for creating a monitor."""
+    model_config = _ARGS_CONFIG
     name: str = Field(description="Name of the monitor")
     query: str = Field(description="Query for the monitor")
     type: str = Field(description="Type of the monitor")
@@ -94,22 +146,36 @@ class MonitorCreate(BaseModel):
     
     @field_validator('type')
     def validate_type(cls, v):
-        valid_types = ["metric alert", "service check", "event alert", "query alert", "composite"]
-        if v not in valid_types:
-            raise ValueError(f"Monitor type must be one of {valid_types}")
+        if v not in _VALID_MONITOR_TYPES:
+            raise ValueError(_MONITOR_TYPE_ERROR)
         return v
 
 class MonitorUpdate(BaseModel):
     """Model for updating a monitor."""
+    model_config = _ARGS_CONFIG
     monitor_id: int = Field(description="ID of the monitor")
     name: Optional[str] = Field(default=None, description="New name for the monitor")
     query: Optional[str] = Field(default=None, description="New query for the monitor")
     message: Optional[str] = Field(default=None, description="New message for the monitor")
     tags: Optional[List[str]] = Field(default=None, description="New list of tags for the monitor")
 
+# Models for Logs API
+class LogQuery(BaseModel):
+    """Model for searching logs."""
+    model_config = _ARGS_CONFIG
+    query: str = Field(description="Log search query")
+    from_time: str = Field(default="now-15m", description="Start of the time range")
+    to_time: str = Field(default="now", description="End of the time range")
+    limit: int = Field(default=100, gt=0, description="Maximum number of log events to return")
+
 # Models for Dashboards API
+_LAYOUT_TYPE_NAMES = ("ordered", "free")
+_VALID_LAYOUT_TYPES = frozenset(_LAYOUT_TYPE_NAMES)
+_LAYOUT_TYPE_ERROR = f"Layout type must be one of {list(_LAYOUT_TYPE_NAMES)}"
+
 class DashboardCreate(BaseModel):
     """Model for creating a dashboard."""
+    model_config = _ARGS_CONFIG
     title: str = Field(description="Title of the dashboard")
     description: Optional[str] = Field(default="", description="Description of the dashboard")
     widgets: List[Dict] = Field(default_factory=list, description="List of widgets for the dashboard")
@@ -117,13 +183,35 @@ class DashboardCreate(BaseModel):
     
     @field_validator('layout_type')
     def validate_layout_type(cls, v):
-        valid_types = ["ordered", "free"]
-        if v not in valid_types:
-            raise ValueError(f"Layout type must be one of {valid_types}")
+        if v not in _VALID_LAYOUT_TYPES:
+            raise ValueError(_LAYOUT_TYPE_ERROR)
         return v
 
+# Server sessions currently sharing the Datadog client
+_lifespan_refs = 0
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Build the shared Datadog client up front and close it after the last session ends."""
+    global _lifespan_refs
+    _lifespan_refs += 1
+    try:
+        get_datadog_client()
+    except ValueError:
+        # Missing credentials are reported by each tool call instead
+        pass
+    try:
+        yield
+    finally:
+        _lifespan_refs -= 1
+        if _lifespan_refs == 0:
+            await close_datadog_client()
+            shutdown_executor()
+
+logger = logging.getLogger("datadog-mcp")
+
 # Initialize FastMCP server
-mcp = FastMCP("datadog")
+mcp = FastMCP("datadog", lifespan=server_lifespan)
 
 load_dotenv()
 
@@ -132,50 +220,507 @@ DATADOG_API_KEY = os.getenv("DATADOG_API_KEY")
 DATADOG_APP_KEY = os.getenv("DATADOG_APP_KEY")
 DATADOG_SITE = os.getenv("DATADOG_SITE", "datadoghq.com")
 
+# Seconds to wait on a Datadog API call unless the SDK passes its own timeout
+_HTTP_TIMEOUT = 30.0
+
+# Pooled connections to the Datadog API, sized for concurrent tool calls
+_HTTP_POOL_SIZE = int(os.getenv("DATADOG_HTTP_POOL_SIZE", max(32, (os.cpu_count() or 1) * 8)))
+
+# Retries for 429/5xx responses, and for connections that fail to open
+_HTTP_MAX_RETRIES = int(os.getenv("DATADOG_MAX_RETRIES", "5"))
+_HTTP_CONNECT_RETRIES = 3
+
+# Client-side request budget per API endpoint (e.g. monitor, dashboard, query)
+_RATE_LIMIT_PER_MINUTE = int(os.getenv("DATADOG_RATE_LIMIT_PER_MINUTE", "300"))
+
+_API_EXCEPTIONS = {
+    401: UnauthorizedException,
+    403: ForbiddenException,
+    404: NotFoundException,
+}
+
+class _HttpxResponse:
+    """Exposes an httpx response through the interface AsyncApiClient reads."""
+
+    __slots__ = ("status", "status_code", "reason", "headers", "data")
+
+    def __init__(self, response: httpx.Response):
+        self.status = self.status_code = response.status_code
+        self.reason = response.reason_phrase
+        self.headers = response.headers
+        self.data = response.content
+
+    async def text(self) -> str:
+        return self.data.decode("utf-8")
+
+    async def content(self) -> bytes:
+        return self.data
+
+class _TokenBucket:
+    """Async token bucket: `rate` requests per `period` seconds, bursting up to `rate`."""
+
+    __slots__ = ("_capacity", "_tokens", "_fill_rate", "_updated", "_lock")
+
+    def __init__(self, rate: int, period: float):
+        self._capacity = float(rate)
+        self._tokens = float(rate)
+        self._fill_rate = rate / period
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._fill_rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns the seconds waited."""
+        async with self._lock:
+            self._refill()
+            wait = 0.0
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self._fill_rate
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= 1
+            return wait
+
+class _HttpxRESTClient:
+    """Async REST transport for the Datadog SDK on a pooled HTTP/2 httpx client.
+
+    Stands in for the SDK's aiosonic-based AsyncRESTClientObject so the
+    async API classes run on the same HTTP stack as the other servers.
+    """
+
+    __slots__ = ("_client", "_configuration", "_limiters", "_etag_cache")
+
+    def __init__(self, configuration: Configuration):
+        # HTTP/2 lets concurrent tool calls share one TLS connection per host
+        self._client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                verify=configuration.ssl_ca_cert or configuration.verify_ssl,
+                proxy=configuration.proxy,
+                limits=httpx.Limits(max_connections=_HTTP_POOL_SIZE, max_keepalive_connections=_HTTP_POOL_SIZE),
+                # Connect errors never reached the server, so any method is safe to retry
+                retries=_HTTP_CONNECT_RETRIES,
+            ),
+            timeout=_HTTP_TIMEOUT,
+        )
+        self._configuration = configuration
+        self._limiters: Dict[str, _TokenBucket] = {}
+        # Last body seen per URL with the validators to revalidate it
+        self._etag_cache = LRUCache(maxsize=256)
+
+    async def _throttle(self, url: str) -> None:
+        """Wait for a token from the rate limiter of the endpoint `url` targets."""
+        # /api/v1/<endpoint>/... -> <endpoint>
+        endpoint = httpx.URL(url).path.split("/", 4)[3:4]
+        endpoint = endpoint[0] if endpoint else ""
+        limiter = self._limiters.get(endpoint)
+        if limiter is None:
+            limiter = self._limiters[endpoint] = _TokenBucket(_RATE_LIMIT_PER_MINUTE, 60)
+        waited = await limiter.acquire()
+        if waited:
+            logger.info("Waited %.2fs for the %r rate limit", waited, endpoint)
+
+    def _retry_delay(self, method: str, response: httpx.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying, or None when the response is final."""
+        if (
+            not self._configuration.enable_retry
+            or attempt >= self._configuration.max_retries
+            or method not in RETRY_ALLOWED_METHODS
+            or response.status_code not in RETRY_AFTER_STATUS_CODES
+        ):
+            return None
+        reset = response.headers.get("X-Ratelimit-Reset")
+        if reset is None:
+            return self._configuration.retry_backoff_factor * (2 ** attempt)
+        return int(reset)
+
+    @staticmethod
+    def _raise_for_status(response: _HttpxResponse) -> None:
+        if not 200 <= response.status <= 299:
+            if response.status >= 500:
+                raise ServiceException(http_resp=response)
+            raise _API_EXCEPTIONS.get(response.status, ApiException)(http_resp=response)
+
+    async def request(self, method, url, query_params=None, headers=None, body=None,
+                      post_params=None, preload_content=True, request_timeout=None):
+        content = None
+        if body is not None:
+            content = orjson.dumps(body)
+            encoding = headers.get("Content-Encoding")
+            if encoding == "gzip":
+                # Level 6 compresses nearly as well as 9 for JSON at a fraction of the CPU
+                content = gzip.compress(content, compresslevel=6)
+            elif encoding == "deflate":
+                content = zlib.compress(content)
+
+        if request_timeout is None:
+            timeout = httpx.USE_CLIENT_DEFAULT
+        elif isinstance(request_timeout, (int, float)):
+            timeout = request_timeout
+        else:
+            timeout = httpx.Timeout(request_timeout[1], connect=request_timeout[0])
+
+        attempt = 0
+        while True:
+            await self._throttle(url)
+            raw = await self._client.request(
+                method, url, params=query_params, headers=headers, content=content, timeout=timeout
+            )
+            delay = self._retry_delay(method, raw, attempt)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        response = _HttpxResponse(raw)
+        self._raise_for_status(response)
+        return response
+
+    async def conditional_get(self, url: str, headers: Dict[str, str]) -> str:
+        """GET a JSON document, answering from the cached body on 304 Not Modified."""
+        cached = self._etag_cache.get(url)
+        if cached is not None:
+            headers = {**headers, **cached[0]}
+        await self._throttle(url)
+        response = _HttpxResponse(await self._client.get(url, headers=headers))
+        if response.status == 304 and cached is not None:
+            return cached[1]
+        self._raise_for_status(response)
+
+        body = response.data.decode("utf-8")
+        validators = {}
+        if "ETag" in response.headers:
+            validators["If-None-Match"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+        if validators:
+            self._etag_cache[url] = (validators, body)
+        return body
+
+    def close(self):
+        # The httpx client is closed asynchronously through aclose()
+        pass
+
+    async def aclose(self):
+        await self._client.aclose()
+
+class _AsyncApiClient(AsyncApiClient):
+    def _build_rest_client(self):
+        return _HttpxRESTClient(self.configuration)
+
+def _lazy_api(module: str, name: str) -> property:
+    """API handle property that imports and builds its API class on first access."""
+    def get(self):
+        api = self.apis.get(name)
+        if api is None:
+            api = self.apis[name] = getattr(importlib.import_module(module), name)(self.api_client)
+        return api
+    return property(get)
+
+def _lazy_endpoint(api: str, method: str) -> property:
+    """Property returning the bound `api.method` callable, resolved once per client."""
+    key = f"{api}.{method}"
+    def get(self):
+        bound = self.apis.get(key)
+        if bound is None:
+            bound = self.apis[key] = getattr(getattr(self, api), method)
+        return bound
+    return property(get)
+
+@functools.lru_cache(maxsize=8)
+def _configuration(api_key: str, app_key: str, site: str) -> Configuration:
+    """SDK configuration for a set of credentials, shared by every client built with them.
+
+    It is never mutated after this, so clients rebuilt for a new event loop reuse it.
+    """
+    configuration = Configuration()
+    configuration.api_key['apiKeyAuth'] = api_key
+    configuration.api_key['appKeyAuth'] = app_key
+    configuration.server_variables['site'] = site
+    # Accept gzip responses and back off on 429/5xx instead of failing the tool call
+    configuration.compress = True
+    configuration.enable_retry = True
+    configuration.max_retries = _HTTP_MAX_RETRIES
+    return configuration
+
 # API Client
-class DatadogClient:
-    def __init__(self, api_key: Optional[str] = None, app_key: Optional[str] = None, site: Optional[str] = None):
-        self.api_key = api_key or DATADOG_API_KEY
-        self.app_key = app_key or DATADOG_APP_KEY
-        self.site = site or DATADOG_SITE
+class DatadogClient(NamedTuple):
+    """Frozen bundle of the configured API client and its API handles.
+
+    Each API module is imported only when a tool first uses it.
+    """
+    configuration: Configuration
+    api_client: AsyncApiClient
+    auth_headers: Dict[str, str]
+    apis: Dict[str, Any]
+
+    metrics_api = _lazy_api("datadog_api_client.v1.api.metrics_api", "MetricsApi")
+    monitors_api = _lazy_api("datadog_api_client.v1.api.monitors_api", "MonitorsApi")
+    events_api = _lazy_api("datadog_api_client.v1.api.events_api", "EventsApi")
+    dashboards_api = _lazy_api("datadog_api_client.v1.api.dashboards_api", "DashboardsApi")
+    logs_api = _lazy_api("datadog_api_client.v2.api.logs_api", "LogsApi")
+
+    # Bound endpoints the tools call, so each call skips the API attribute chain
+    submit_metrics = _lazy_endpoint("metrics_api", "submit_metrics")
+    create_event = _lazy_endpoint("events_api", "create_event")
+    list_events = _lazy_endpoint("events_api", "list_events")
+    create_monitor = _lazy_endpoint("monitors_api", "create_monitor")
+    update_monitor = _lazy_endpoint("monitors_api", "update_monitor")
+    delete_monitor = _lazy_endpoint("monitors_api", "delete_monitor")
+    list_logs_with_pagination = _lazy_endpoint("logs_api", "list_logs_with_pagination")
+    create_dashboard = _lazy_endpoint("dashboards_api", "create_dashboard")
+    delete_dashboard = _lazy_endpoint("dashboards_api", "delete_dashboard")
+
+    @classmethod
+    def create(cls, api_key: Optional[str] = None, app_key: Optional[str] = None, site: Optional[str] = None) -> "DatadogClient":
+        api_key = api_key or DATADOG_API_KEY
+        app_key = app_key or DATADOG_APP_KEY
+        site = site or DATADOG_SITE
         
-        if not self.api_key:
+        if not api_key:
             raise ValueError("DATADOG_API_KEY is required")
-        if not self.app_key:
+        if not app_key:
             raise ValueError("DATADOG_APP_KEY is required")
             
-        self.configuration = Configuration()
-        self.configuration.api_key['apiKeyAuth'] = self.api_key
-        self.configuration.api_key['appKeyAuth'] = self.app_key
-        self.configuration.server_variables['site'] = self.site
-        
-        self.api_client = ApiClient(self.configuration)
-        self.metrics_api = MetricsApi(self.api_client)
-        self.monitors_api = MonitorsApi(self.api_client)
-        self.events_api = EventsApi(self.api_client)
-        self.dashboards_api = DashboardsApi(self.api_client)
+        configuration = _configuration(api_key, app_key, site)
+        return cls(
+            configuration=configuration,
+            api_client=_AsyncApiClient(configuration),
+            auth_headers={
+                "DD-API-KEY": api_key,
+                "DD-APPLICATION-KEY": app_key,
+                "Accept": "application/json",
+            },
+            apis={},
+        )
     
-    def __enter__(self):
-        return self
+    async def get_json(self, path: str) -> str:
+        """Fetch an API path as raw JSON with ETag/Last-Modified revalidation."""
+        return await self.api_client.rest_client.conditional_get(self.configuration.host + path, self.auth_headers)
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.api_client.close()
+    async def post_json(self, path: str, body: Any) -> str:
+        """POST a plain JSON body to an API path without building SDK models."""
+        response = await self.api_client.rest_client.request(
+            "POST",
+            self.configuration.host + path,
+            headers={**self.auth_headers, "Content-Type": "application/json"},
+            body=body,
+        )
+        return response.data.decode("utf-8")
+    
+    async def aclose(self):
+        await self.api_client.rest_client.aclose()
+
+_datadog_client: Optional[DatadogClient] = None
+_datadog_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
 # Helper Functions
 def get_datadog_client() -> DatadogClient:
-    """Get an initialized Datadog API client."""
-    client = DatadogClient(
-        api_key=DATADOG_API_KEY,
-        app_key=DATADOG_APP_KEY
-    )
-    return client
+    """Get the shared Datadog API client, creating it on first use.
+    
+    Pooled connections belong to the event loop that opened them, so the
+    client is rebuilt if the tools are later driven from another loop.
+    """
+    global _datadog_client, _datadog_client_loop
+    loop = asyncio.get_running_loop()
+    if _datadog_client is None or _datadog_client_loop is not loop:
+        _datadog_client_loop = loop
+        # Credentials come from the environment read once at import
+        _datadog_client = DatadogClient.create()
+    return _datadog_client
+
+async def close_datadog_client() -> None:
+    """Flush buffered metrics and close the shared Datadog API client."""
+    global _datadog_client, _metric_flusher
+    if _metric_flusher is not None:
+        _metric_flusher.cancel()
+        _metric_flusher = None
+    if _background_writes:
+        await asyncio.gather(*_background_writes, return_exceptions=True)
+    if _datadog_client is not None:
+        await flush_metrics()
+        client, _datadog_client = _datadog_client, None
+        await client.aclose()
+
+def _dumps(obj: Any) -> str:
+    """Serialize tool output with orjson, stringifying dates and other non-JSON values."""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+def _response_json(response) -> str:
+    """Serialize an SDK response model with orjson."""
+    return _dumps(response.to_dict())
+
+# Read results larger than the threshold are stored in this bucket and returned as an s3:// URL
+DATADOG_OFFLOAD_BUCKET = os.getenv("DATADOG_OFFLOAD_BUCKET")
+_OFFLOAD_THRESHOLD = int(os.getenv("DATADOG_OFFLOAD_THRESHOLD", str(256 * 1024)))
+_OFFLOAD_TTL = int(os.getenv("DATADOG_OFFLOAD_TTL", "86400"))
+
+# Bounded pool for the blocking calls left on the request path (boto3 uploads)
+_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=_HTTP_POOL_SIZE, thread_name_prefix="dd-sdk")
+    return _executor
+
+def shutdown_executor() -> None:
+    """Wait for queued blocking calls to finish and release the worker threads."""
+    global _executor
+    if _executor is not None:
+        executor, _executor = _executor, None
+        executor.shutdown(wait=True)
+
+@functools.lru_cache(maxsize=1)
+def _s3_client():
+    import boto3
+    return boto3.client("s3")
+
+async def _maybe_offload(body: str) -> str:
+    """Swap a large tool result for a pointer to a copy stored in S3."""
+    if not DATADOG_OFFLOAD_BUCKET or len(body) <= _OFFLOAD_THRESHOLD:
+        return body
+    data = body.encode("utf-8")
+    key = f"datadog-mcp/{hashlib.blake2b(data, digest_size=16).hexdigest()}.json"
+    try:
+        await asyncio.get_running_loop().run_in_executor(_get_executor(), functools.partial(
+            _s3_client().put_object,
+            Bucket=DATADOG_OFFLOAD_BUCKET,
+            Key=key,
+            Body=data,
+            ContentType="application/json",
+            Metadata={"ttl": str(_OFFLOAD_TTL)},
+        ))
+    except Exception as e:
+        logger.warning("Returning %d byte response inline, S3 offload failed: %s", len(data), e)
+        return body
+    return _dumps({
+        "status": "success",
+        "message": f"Response of {len(data)} bytes stored in S3",
+        "url": f"s3://{DATADOG_OFFLOAD_BUCKET}/{key}",
+    })
+
+# Read-tool response caches by resource group; writes clear their group
+_response_caches: Dict[str, List[TTLCache]] = {}
+
+# Tool results starting with this are errors and are never cached
+_ERROR_PREFIX = _dumps({"status": "error"})[:-1]
+
+# Cache misses currently being fetched, shared by concurrent identical calls
+_inflight: Dict[bytes, asyncio.Future] = {}
+
+def cached_response(group: str, ttl: float):
+    """Serve repeat calls to a read-only tool from a TTL cache for `ttl` seconds.
+
+    Concurrent misses for the same arguments share a single call to Datadog.
+    """
+    cache = TTLCache(maxsize=1024, ttl=ttl)
+    _response_caches.setdefault(group, []).append(cache)
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        async def fetch(key, args, kwargs):
+            result = await fn(*args, **kwargs)
+            if not result.startswith(_ERROR_PREFIX):
+                cache[key] = result
+            return result
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = hashlib.blake2b(repr((fn.__name__, bound.args, bound.kwargs)).encode(), digest_size=16).digest()
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            future = _inflight.get(key)
+            if future is None:
+                future = asyncio.ensure_future(fetch(key, args, kwargs))
+                _inflight[key] = future
+                future.add_done_callback(lambda _: _inflight.pop(key, None))
+            # Shield so a cancelled caller does not cancel the call for the others
+            return await asyncio.shield(future)
+
+        return wrapper
+
+    return decorator
+
+def invalidate_cache(group: str) -> None:
+    """Drop every cached response for a resource group after a write."""
+    for cache in _response_caches.get(group, ()):
+        cache.clear()
+
+# Metric batching: submit_metric buffers series and a background task posts them together
+_METRIC_FLUSH_INTERVAL = float(os.getenv("DATADOG_METRIC_FLUSH_INTERVAL", "2"))
+# Series per submit_metrics request
+_METRIC_MAX_BATCH = int(os.getenv("DATADOG_METRIC_MAX_BATCH", "500"))
+# Queued points that trigger a flush before the next interval
+_METRIC_FLUSH_POINTS = int(os.getenv("DATADOG_METRIC_FLUSH_POINTS", "500"))
+# Batches with at least this many points are gzip-compressed on the wire
+_METRIC_GZIP_MIN_POINTS = 50
+_GZIP = MetricContentEncoding("gzip")
+
+# Fire-and-forget writes still running; awaited before the client closes
+_background_writes: set = set()
+
+def _spawn_write(coro) -> None:
+    """Run a write in the background, keeping a reference until it finishes."""
+    task = asyncio.create_task(coro)
+    _background_writes.add(task)
+    task.add_done_callback(_background_writes.discard)
+
+# Buffered series keyed by (metric, tags); points for the same key share one series
+_pending_series: Dict[tuple, Series] = {}
+_pending_points = 0
+_metric_flusher: Optional[asyncio.Task] = None
+
+async def flush_metrics() -> None:
+    """Submit every buffered series, at most _METRIC_MAX_BATCH per request."""
+    global _pending_series, _pending_points
+    pending, _pending_series, _pending_points = list(_pending_series.values()), {}, 0
+    for start in range(0, len(pending), _METRIC_MAX_BATCH):
+        batch = pending[start:start + _METRIC_MAX_BATCH]
+        try:
+            if sum(len(series.points) for series in batch) >= _METRIC_GZIP_MIN_POINTS:
+                await get_datadog_client().submit_metrics(body=MetricsPayload(series=batch), content_encoding=_GZIP)
+            else:
+                await get_datadog_client().submit_metrics(body=MetricsPayload(series=batch))
+        except Exception as e:
+            logger.error("Dropped %d metric series: %s", len(batch), e)
+
+async def _flush_metrics_loop() -> None:
+    while True:
+        await asyncio.sleep(_METRIC_FLUSH_INTERVAL)
+        await flush_metrics()
+
+def _queue_series(series: Series) -> None:
+    """Buffer a series, starting the flusher or flushing early as needed."""
+    global _metric_flusher, _pending_points
+    key = (series.metric, tuple(series.tags or ()))
+    pending = _pending_series.get(key)
+    if pending is None:
+        _pending_series[key] = series
+    else:
+        pending.points.extend(series.points)
+    _pending_points += len(series.points)
+    if _metric_flusher is None or _metric_flusher.done() or _metric_flusher.get_loop() is not asyncio.get_running_loop():
+        _metric_flusher = asyncio.create_task(_flush_metrics_loop())
+    if _pending_points >= _METRIC_FLUSH_POINTS:
+        _spawn_write(flush_metrics())
 
 # MCP Tools - Metrics Management
 
-@mcp.tool()
-def submit_metric(metric_name: str, value: float, timestamp: Optional[int] = None, tags: Optional[List[str]] = None) -> str:
+async def submit_metric(metric_name: str, value: float, timestamp: Optional[int] = None, tags: Optional[List[str]] = None) -> str:
     """Submit a metric to Datadog.
     
+    Points are buffered and sent in batches every few seconds, so this
+    returns as soon as the metric is queued.
+    
     Args:
         metric_name: Name of the metric
         value: Value of the metric
@@ -191,69 +736,83 @@ def submit_metric(metric_name: str, value: float, timestamp: Optional[int] = Non
             tags=tags
         )
         
-        with get_datadog_client() as client:
-            # If timestamp is not provided, it will be set to current time by the API
-            current_timestamp = timestamp if timestamp else int(time.time())
-            
-            body = MetricsPayload(
-                series=[
-                    Series(
-                        metric=metric_data.metric_name,
-                        points=[[current_timestamp, metric_data.value]],
-                        tags=metric_data.tags
-                    )
-                ]
+        # Fail fast on missing credentials rather than in the background flush
+        get_datadog_client()
+        # If timestamp is not provided, it will be set to current time by the API
+        current_timestamp = timestamp if timestamp else time.time_ns() // 1_000_000_000
+        
+        _queue_series(
+            Series(
+                metric=metric_data.metric_name,
+                points=[[current_timestamp, metric_data.value]],
+                tags=metric_data.tags,
+                # MetricSubmit already validated these, skip the SDK's second pass
+                _check_type=False
             )
-            
-            response = client.metrics_api.submit_metrics(body=body)
-            return json.dumps({"status": "success", "message": "Metric submitted successfully"})
+        )
+        return _dumps({"status": "success", "message": "Metric queued for submission"})
             
     except ValueError as e:
         # Handle validation errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
     except Exception as e:
         # Handle API errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
 
-@mcp.tool()
-def query_metrics(query: str, from_time: int, to_time: int) -> str:
+@cached_response("metrics", ttl=30)
+async def query_metrics(query: str, from_time: int, to_time: int, fields: Optional[List[str]] = None) -> str:
     """Query metrics from Datadog.
     
     Args:
         query: Metric query string
         from_time: Start time in seconds since epoch
         to_time: End time in seconds since epoch
+        fields: Keys to keep on each series (e.g. metric, scope, pointlist); all when omitted
     """
     try:
         # Create model instance to validate params
         query_data = MetricQuery(
             query=query,
             from_time=from_time,
-            to_time=to_time
+            to_time=to_time,
+            fields=fields
         )
         
-        with get_datadog_client() as client:
-            # In v1 API, we use the query_metrics endpoint directly with parameters
-            params = {
-                "query": query_data.query,
-                "from": query_data.from_time,
-                "to": query_data.to_time
-            }
-            
-            response = client.metrics_api.query_metrics(**params)
-            return json.dumps(response.to_dict())
+        client = get_datadog_client()
+        # Point arrays dominate the response, so it is passed through as raw JSON
+        # rather than built into SDK models and serialized back
+        params = urlencode({
+            "query": query_data.query,
+            "from": query_data.from_time,
+            "to": query_data.to_time
+        })
+        body = await client.get_json(f"/api/v1/query?{params}")
+        if query_data.fields is not None:
+            result = orjson.loads(body)
+            result["series"] = [
+                {key: series[key] for key in query_data.fields if key in series}
+                for series in result.get("series") or ()
+            ]
+            body = _dumps(result)
+        return await _maybe_offload(body)
             
     except ValueError as e:
         # Handle validation errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
     except Exception as e:
         # Handle API errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
 
 # MCP Tools - Events Management
 
-@mcp.tool()
-def create_event(title: str, text: str, tags: Optional[List[str]] = None, alert_type: str = "info", priority: str = "normal") -> str:
+async def _post_event(client: DatadogClient, body: EventCreateRequest) -> None:
+    try:
+        await client.create_event(body=body)
+        invalidate_cache("events")
+    except Exception as e:
+        logger.error("Dropped event %r: %s", body.title, e)
+
+async def create_event(title: str, text: str, tags: Optional[List[str]] = None, alert_type: str = "info", priority: str = "normal", fire_and_forget: bool = False) -> str:
     """Create an event in Datadog.
     
     Args:
@@ -262,6 +821,8 @@ def create_event(title: str, text: str, tags: Optional[List[str]] = None, alert_
         tags: List of tags for the event
         alert_type: Alert type (info, warning, error, success)
         priority: Priority (normal, low)
+        fire_and_forget: Return as soon as the event is validated and post it in
+            the background; the response then carries no event details
     """
     try:
         # Create model instance to validate params
@@ -273,31 +834,34 @@ def create_event(title: str, text: str, tags: Optional[List[str]] = None, alert_
             priority=priority
         )
         
-        with get_datadog_client() as client:
-            # Use v1 API for events - Event model is directly available in v1
-            from datadog_api_client.v1.model.event import Event
-            
-            # Create event with v1 API format
-            body = Event(
-                title=event_data.title,
-                text=event_data.text,
-                tags=event_data.tags,
-                alert_type=event_data.alert_type,
-                priority=event_data.priority
-            )
-            
-            response = client.events_api.create_event(body=body)
-            return json.dumps(response.to_dict())
+        client = get_datadog_client()
+        # Create event with v1 API format
+        body = EventCreateRequest(
+            title=event_data.title,
+            text=event_data.text,
+            tags=event_data.tags,
+            alert_type=_EVENT_ALERT_TYPES[event_data.alert_type],
+            priority=_EVENT_PRIORITIES[event_data.priority],
+            _check_type=False
+        )
+        
+        if fire_and_forget:
+            _spawn_write(_post_event(client, body))
+            return _dumps({"status": "accepted", "message": "Event queued for submission"})
+        
+        response = await client.create_event(body=body)
+        invalidate_cache("events")
+        return _response_json(response)
             
     except ValueError as e:
         # Handle validation errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
     except Exception as e:
         # Handle API errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
 
-@mcp.tool()
-def get_events(query: Optional[str] = None, from_time: Optional[int] = None, to_time: Optional[int] = None) -> str:
+@cached_response("events", ttl=10)
+async def get_events(query: Optional[str] = None, from_time: Optional[int] = None, to_time: Optional[int] = None) -> str:
     """Get events from Datadog.
     
     Args:
@@ -306,26 +870,25 @@ def get_events(query: Optional[str] = None, from_time: Optional[int] = None, to_
         to_time: End time in seconds since epoch
     """
     try:
-        with get_datadog_client() as client:
-            params = {}
-            if query:
-                params["filter[query]"] = query
-            if from_time:
-                params["filter[from]"] = from_time
-            if to_time:
-                params["filter[to]"] = to_time
-                
-            response = client.events_api.list_events(**params)
-            return json.dumps(response.to_dict())
+        client = get_datadog_client()
+        params = {}
+        if query:
+            params["filter[query]"] = query
+        if from_time:
+            params["filter[from]"] = _epoch(from_time)
+        if to_time:
+            params["filter[to]"] = _epoch(to_time)
+            
+        response = await client.list_events(**params)
+        return await _maybe_offload(_response_json(response))
             
     except Exception as e:
         # Handle API errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
 
 # MCP Tools - Monitors Management
 
-@mcp.tool()
-def create_monitor(name: str, query: str, type: str, message: str, tags: Optional[List[str]] = None) -> str:
+async def create_monitor(name: str, query: str, type: str, message: str, tags: Optional[List[str]] = None) -> str:
     """Create a monitor in Datadog.
     
     Args:
@@ -345,47 +908,43 @@ def create_monitor(name: str, query: str, type: str, message: str, tags: Optiona
             tags=tags
         )
         
-        with get_datadog_client() as client:
-            # Use v1 API for monitors
-            from datadog_api_client.v1.model.monitor import Monitor
-            
-            # In v1 API, we use the Monitor model directly
-            body = Monitor(
-                name=monitor_data.name,
-                type=monitor_data.type,  # v1 API uses string types directly
-                query=monitor_data.query,
-                message=monitor_data.message,
-                tags=monitor_data.tags
-            )
-            
-            response = client.monitors_api.create_monitor(body=body)
-            return json.dumps(response.to_dict())
+        client = get_datadog_client()
+        # In v1 API, we use the Monitor model directly
+        body = Monitor(
+            name=monitor_data.name,
+            type=_MONITOR_TYPES[monitor_data.type],
+            query=monitor_data.query,
+            message=monitor_data.message,
+            tags=monitor_data.tags
+        )
+        
+        response = await client.create_monitor(body=body)
+        invalidate_cache("monitors")
+        return _response_json(response)
             
     except ValueError as e:
         # Handle validation errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
     except Exception as e:
         # Handle API errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
 
-@mcp.tool()
-def get_monitor(monitor_id: int) -> str:
+@cached_response("monitors", ttl=10)
+async def get_monitor(monitor_id: int) -> str:
     """Get a monitor from Datadog.
     
     Args:
         monitor_id: ID of the monitor
     """
     try:
-        with get_datadog_client() as client:
-            response = client.monitors_api.get_monitor(monitor_id=monitor_id)
-            return json.dumps(response.to_dict())
+        client = get_datadog_client()
+        return await client.get_json(f"/api/v1/monitor/{monitor_id}")
             
     except Exception as e:
         # Handle API errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
 
-@mcp.tool()
-def update_monitor(monitor_id: int, name: Optional[str] = None, query: Optional[str] = None, message: Optional[str] = None, tags: Optional[List[str]] = None) -> str:
+async def update_monitor(monitor_id: int, name: Optional[str] = None, query: Optional[str] = None, message: Optional[str] = None, tags: Optional[List[str]] = None) -> str:
     """Update a monitor in Datadog.
     
     Args:
@@ -405,53 +964,106 @@ def update_monitor(monitor_id: int, name: Optional[str] = None, query: Optional[
             tags=tags
         )
         
-        with get_datadog_client() as client:
-            # Use v1 API for monitor updates
-            from datadog_api_client.v1.model.monitor import Monitor
+        client = get_datadog_client()
+        attributes = {}
+        if monitor_data.name:
+            attributes["name"] = monitor_data.name
+        if monitor_data.query:
+            attributes["query"] = monitor_data.query
+        if monitor_data.message:
+            attributes["message"] = monitor_data.message
+        if monitor_data.tags:
+            attributes["tags"] = monitor_data.tags
             
-            attributes = {}
-            if monitor_data.name:
-                attributes["name"] = monitor_data.name
-            if monitor_data.query:
-                attributes["query"] = monitor_data.query
-            if monitor_data.message:
-                attributes["message"] = monitor_data.message
-            if monitor_data.tags:
-                attributes["tags"] = monitor_data.tags
-                
-            # In v1 API, we create a Monitor object with only the fields we want to update
-            body = Monitor(**attributes)
-            
-            response = client.monitors_api.update_monitor(monitor_id=monitor_data.monitor_id, body=body)
-            return json.dumps(response.to_dict())
+        # In v1 API, we create a Monitor object with only the fields we want to update
+        body = Monitor(**attributes)
+        
+        response = await client.update_monitor(monitor_id=monitor_data.monitor_id, body=body)
+        invalidate_cache("monitors")
+        return _response_json(response)
             
     except ValueError as e:
         # Handle validation errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
     except Exception as e:
         # Handle API errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
 
-@mcp.tool()
-def delete_monitor(monitor_id: int) -> str:
+async def delete_monitor(monitor_id: int) -> str:
     """Delete a monitor from Datadog.
     
     Args:
         monitor_id: ID of the monitor
     """
     try:
-        with get_datadog_client() as client:
-            response = client.monitors_api.delete_monitor(monitor_id=monitor_id)
-            return json.dumps({"status": "success", "message": f"Monitor {monitor_id} deleted successfully"})
+        client = get_datadog_client()
+        await client.delete_monitor(monitor_id=monitor_id)
+        invalidate_cache("monitors")
+        return _dumps({"status": "success", "message": f"Monitor {monitor_id} deleted successfully"})
             
     except Exception as e:
         # Handle API errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
+
+# MCP Tools - Logs Management
+
+# Largest page the logs search API returns
+_LOGS_MAX_PAGE = 1000
+
+async def query_logs(query: str, from_time: str = "now-15m", to_time: str = "now", limit: int = 100) -> str:
+    """Search logs in Datadog.
+    
+    Logs are fetched one page at a time and returned grouped by page.
+    
+    Args:
+        query: Log search query (e.g. "service:web status:error")
+        from_time: Start of the time range (date math such as "now-15m", ISO 8601, or milliseconds since epoch)
+        to_time: End of the time range (same formats as from_time)
+        limit: Maximum number of log events to return
+    """
+    try:
+        # Create model instance to validate params
+        log_query = LogQuery(
+            query=query,
+            from_time=from_time,
+            to_time=to_time,
+            limit=limit
+        )
+        
+        client = get_datadog_client()
+        page_size = min(log_query.limit, _LOGS_MAX_PAGE)
+        body = LogsListRequest(
+            filter=LogsQueryFilter(query=log_query.query, _from=log_query.from_time, to=log_query.to_time),
+            page=LogsListRequestPage(limit=page_size)
+        )
+        
+        pages: List[List[Dict]] = []
+        page: List[Dict] = []
+        count = 0
+        # The paginator requests the next page only once this one is consumed
+        async for log in client.list_logs_with_pagination(body=body):
+            page.append(log.to_dict())
+            count += 1
+            if len(page) == page_size:
+                pages.append(page)
+                page = []
+            if count >= log_query.limit:
+                break
+        if page:
+            pages.append(page)
+        
+        return await _maybe_offload(_dumps({"count": count, "pages": pages}))
+            
+    except ValueError as e:
+        # Handle validation errors
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
+    except Exception as e:
+        # Handle API errors
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
 
 # MCP Tools - Dashboards Management
 
-@mcp.tool()
-def create_dashboard(title: str, description: str = "", widgets: Optional[List[Dict]] = None, layout_type: str = "ordered") -> str:
+async def create_dashboard(title: str, description: str = "", widgets: Optional[List[Dict]] = None, layout_type: str = "ordered", skip_validation: bool = False) -> str:
     """Create a dashboard in Datadog.
     
     Args:
@@ -459,6 +1071,8 @@ def create_dashboard(title: str, description: str = "", widgets: Optional[List[D
         description: Description of the dashboard
         widgets: List of widgets for the dashboard
         layout_type: Layout type of the dashboard (ordered, free)
+        skip_validation: Send the widgets as given, without building SDK widget
+            models; faster for large dashboards whose widgets are already valid
     """
     try:
         # Create model instance to validate params
@@ -469,60 +1083,90 @@ def create_dashboard(title: str, description: str = "", widgets: Optional[List[D
             layout_type=layout_type
         )
         
-        with get_datadog_client() as client:
-            # Use v1 API for dashboards
-            from datadog_api_client.v1.model.dashboard import Dashboard
-            from datadog_api_client.v1.model.dashboard_layout_type import DashboardLayoutType
-            
-            # Create dashboard with v1 API format
-            body = Dashboard(
-                title=dashboard_data.title,
-                description=dashboard_data.description,
-                widgets=dashboard_data.widgets,
-                layout_type=dashboard_data.layout_type
-            )
-            
-            response = client.dashboards_api.create_dashboard(body=body)
-            return json.dumps(response.to_dict())
+        client = get_datadog_client()
+        if skip_validation:
+            # Datadog still validates the dashboard server-side
+            result = await client.post_json("/api/v1/dashboard", {
+                "title": dashboard_data.title,
+                "description": dashboard_data.description,
+                "widgets": dashboard_data.widgets,
+                "layout_type": dashboard_data.layout_type,
+            })
+            invalidate_cache("dashboards")
+            return result
+        
+        # Create dashboard with v1 API format
+        body = Dashboard(
+            title=dashboard_data.title,
+            description=dashboard_data.description,
+            widgets=dashboard_data.widgets,
+            layout_type=_LAYOUT_TYPES[dashboard_data.layout_type]
+        )
+        
+        response = await client.create_dashboard(body=body)
+        invalidate_cache("dashboards")
+        return _response_json(response)
             
     except ValueError as e:
         # Handle validation errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
     except Exception as e:
         # Handle API errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
 
-@mcp.tool()
-def get_dashboard(dashboard_id: str) -> str:
+@cached_response("dashboards", ttl=60)
+async def get_dashboard(dashboard_id: str) -> str:
     """Get a dashboard from Datadog.
     
     Args:
         dashboard_id: ID of the dashboard
     """
     try:
-        with get_datadog_client() as client:
-            response = client.dashboards_api.get_dashboard(dashboard_id=dashboard_id)
-            return json.dumps(response.to_dict())
+        client = get_datadog_client()
+        return await _maybe_offload(await client.get_json(f"/api/v1/dashboard/{quote(dashboard_id, safe='')}"))
             
     except Exception as e:
         # Handle API errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
 
-@mcp.tool()
-def delete_dashboard(dashboard_id: str) -> str:
+async def delete_dashboard(dashboard_id: str) -> str:
     """Delete a dashboard from Datadog.
     
     Args:
         dashboard_id: ID of the dashboard
     """
     try:
-        with get_datadog_client() as client:
-            response = client.dashboards_api.delete_dashboard(dashboard_id=dashboard_id)
-            return json.dumps({"status": "success", "message": f"Dashboard {dashboard_id} deleted successfully"})
+        client = get_datadog_client()
+        await client.delete_dashboard(dashboard_id=dashboard_id)
+        invalidate_cache("dashboards")
+        return _dumps({"status": "success", "message": f"Dashboard {dashboard_id} deleted successfully"})
             
     except Exception as e:
         # Handle API errors
-        return json.dumps(DatadogErrorResponse(message=str(e)).model_dump())
+        return _dumps(DatadogErrorResponse(message=str(e)).model_dump())
+
+# Tool registration
+
+# Toolset name -> tools, registered in this order
+_TOOLSETS = {
+    "metrics": (submit_metric, query_metrics),
+    "events": (create_event, get_events),
+    "monitors": (create_monitor, get_monitor, update_monitor, delete_monitor),
+    "logs": (query_logs,),
+    "dashboards": (create_dashboard, get_dashboard, delete_dashboard),
+}
+
+# Comma-separated toolsets to expose (default: all); API modules of disabled toolsets are never imported
+DATADOG_ENABLED_TOOLSETS = os.getenv("DATADOG_ENABLED_TOOLSETS")
+
+def register_tools(enabled: Optional[set] = None) -> None:
+    """Register the tools of every enabled toolset with the MCP server."""
+    for toolset, tools in _TOOLSETS.items():
+        if enabled is None or toolset in enabled:
+            for tool in tools:
+                mcp.tool()(tool)
+
+register_tools({name.strip() for name in DATADOG_ENABLED_TOOLSETS.split(",")} if DATADOG_ENABLED_TOOLSETS else None)
 
 # Main entry point
 if __name__ == "__main__":
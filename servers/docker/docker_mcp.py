@@ -6,11 +6,18 @@ interacting with Docker. It enables management of containers, images,
 networks, and volumes through a standardized interface.
 """
 
-import json
 import os
+import asyncio
+import functools
 import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple, Union
 import docker
+import orjson
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP, Context
 
 # Configure logging
@@ -20,19 +27,162 @@ logger = logging.getLogger("docker-mcp")
 # Initialize FastMCP server
 mcp = FastMCP("docker")
 
+# Connections kept open to the daemon, so concurrent tool calls reuse sockets
+DOCKER_POOL_SIZE = 32
+
+# Pinning the API version skips the /version probe docker-py makes at startup
+DOCKER_API_VERSION = os.getenv("DOCKER_API_VERSION")
+
 # Create Docker client
 try:
-    docker_client = docker.from_env()
+    docker_client = docker.from_env(max_pool_size=DOCKER_POOL_SIZE, version=DOCKER_API_VERSION)
     logger.info("Successfully connected to Docker daemon")
 except Exception as e:
-    logger.error(f"Failed to connect to Docker daemon: {e}")
+    logger.error("Failed to connect to Docker daemon: %s", e)
     raise
 
+def _orjson_result(api: docker.APIClient, response: Any, json: bool = False, binary: bool = False) -> Any:
+    """APIClient._result that parses JSON bodies with orjson, straight from the raw bytes."""
+    if json:
+        api._raise_for_status(response)
+        return orjson.loads(response.content)
+    return docker.APIClient._result(api, response, json=json, binary=binary)
+
+# Every daemon JSON response (listings, inspects) goes through _result
+docker_client.api._result = functools.partial(_orjson_result, docker_client.api)
+
+# docker-py is blocking, so SDK calls run here to let concurrent tools overlap
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="docker-sdk")
+
+async def _run(fn, *args, **kwargs):
+    """Run a blocking docker-py call on the SDK thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(_EXECUTOR, functools.partial(fn, *args, **kwargs))
+
+def _tool(action: str):
+    """Report any exception from the tool as "Error <action>: <reason>" instead of raising."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                logger.error("Error %s: %s", action, e)
+                return f"Error {action}: {e}"
+        return wrapper
+    return decorator
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result as indented JSON."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+def _timestamp(epoch: int) -> str:
+    """Format the epoch seconds of a listing entry as an ISO-8601 UTC timestamp."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(epoch))
+
+# Handles from recent .get() lookups, so back-to-back operations on the same
+# object skip the inspect round-trip. The short TTL keeps removed objects from
+# lingering.
+_HANDLE_TTL = 2.0
+_container_handles = TTLCache(maxsize=256, ttl=_HANDLE_TTL)
+_network_handles = TTLCache(maxsize=256, ttl=_HANDLE_TTL)
+_volume_handles = TTLCache(maxsize=256, ttl=_HANDLE_TTL)
+# Guards the handle caches, which are used from the SDK threads
+_handles_lock = threading.Lock()
+
+def _cached_get(cache: TTLCache, collection: Any, key: str) -> Any:
+    with _handles_lock:
+        handle = cache.get(key)
+    if handle is None:
+        handle = collection.get(key)
+        with _handles_lock:
+            cache[key] = handle
+    return handle
+
+def _get_container(container_id: str) -> Any:
+    return _cached_get(_container_handles, docker_client.containers, container_id)
+
+def _get_network(network_id: str) -> Any:
+    return _cached_get(_network_handles, docker_client.networks, network_id)
+
+def _get_volume(volume_name: str) -> Any:
+    return _cached_get(_volume_handles, docker_client.volumes, volume_name)
+
+def _forget(cache: TTLCache, handle: Any) -> None:
+    """Drop every cached alias (ID or name) of a removed object."""
+    with _handles_lock:
+        for key in [key for key, cached in cache.items() if cached.id == handle.id]:
+            cache.pop(key, None)
+
+# Serialized list_* results. Agents tend to repeat a listing within seconds, so
+# a repeat inside the TTL is answered without asking the daemon. Every tool
+# that changes containers, images, networks, or volumes clears the cache.
+_RESULT_TTL = 0.5
+_results = TTLCache(maxsize=64, ttl=_RESULT_TTL)
+
+def _cached_result(fn):
+    """Serve repeated calls of a listing tool from _results."""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+        result = _results.get(key)
+        if result is None:
+            result = _results[key] = await fn(*args, **kwargs)
+        return result
+    return wrapper
+
+def _invalidates_results(fn):
+    """Clear _results once a mutating tool finishes, whether or not it succeeded."""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            _results.clear()
+    return wrapper
+
 #
 # Container Tools
 #
 
+def _port_map(ports: List[Dict[str, Any]]) -> Dict[str, Optional[List[Dict[str, str]]]]:
+    """Convert /containers/json port entries to the inspect-style {"80/tcp": [bindings]} mapping."""
+    mapping = {}
+    for port in ports:
+        key = f"{port['PrivatePort']}/{port['Type']}"
+        if "PublicPort" in port:
+            bindings = mapping.get(key) or []
+            bindings.append({"HostIp": port.get("IP", ""), "HostPort": str(port["PublicPort"])})
+            mapping[key] = bindings
+        else:
+            mapping.setdefault(key, None)
+    return mapping
+
+def _image_tags(images: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Map image IDs from a raw /images/json listing to their real tags."""
+    return {
+        image["Id"]: [tag for tag in image.get("RepoTags") or () if tag != "<none>:<none>"]
+        for image in images
+    }
+
+def _container_name(name: str) -> str:
+    """Drop the single leading slash the daemon puts on container names."""
+    return name[1:] if name.startswith("/") else name
+
+def _container_summary(container: Dict[str, Any], image_tags: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Summarize a raw /containers/json entry."""
+    image_id = container["ImageID"]
+    return {
+        "id": container["Id"][:12],
+        "name": _container_name(container["Names"][0]),
+        "image": next(iter(image_tags.get(image_id, ())), image_id),
+        "status": container["State"],
+        "created": _timestamp(container["Created"]),
+        "ports": _port_map(container["Ports"])
+    }
+
 @mcp.tool()
+@_tool("listing containers")
+@_cached_result
 async def list_containers(show_all: bool = False) -> str:
     """List all containers or only running ones.
     
@@ -42,26 +192,55 @@ async def list_containers(show_all: bool = False) -> str:
     Returns:
         String representation of containers list.
     """
-    try:
-        containers = docker_client.containers.list(all=show_all)
-        container_list = []
-        
-        for container in containers:
-            container_list.append({
-                "id": container.short_id,
-                "name": container.name,
-                "image": container.image.tags[0] if container.image.tags else container.image.id,
-                "status": container.status,
-                "created": container.attrs["Created"],
-                "ports": container.ports
-            })
-        
-        return json.dumps(container_list, indent=2)
-    except Exception as e:
-        logger.error(f"Error listing containers: {e}")
-        return f"Error listing containers: {str(e)}"
+    # One listing call each for containers and images, instead of an
+    # inspect per container and per container image
+    containers, images = await asyncio.gather(
+        _run(docker_client.api.containers, all=show_all),
+        _run(docker_client.api.images)
+    )
+    image_tags = _image_tags(images)
+    container_list = [_container_summary(container, image_tags) for container in containers]
+
+    return _dumps(container_list)
+
+def _volume_bindings(volumes: Optional[Dict[str, str]]) -> Optional[Dict[str, Dict[str, str]]]:
+    """Docker SDK volume spec for a {host path: container path} mapping.
+
+    A container path may carry a mode suffix as in a bind string ("/data:ro");
+    without one the volume is mounted read-write.
+    """
+    if not volumes:
+        return None
+    return {
+        host_vol: {"bind": bind, "mode": mode or "rw"}
+        for host_vol, container_vol in volumes.items()
+        for bind, _, mode in [container_vol.partition(":")]
+    }
+
+def _container_args(
+    image: str,
+    name: Optional[str],
+    command: Optional[str],
+    ports: Optional[Dict[str, str]],
+    environment: Optional[Dict[str, str]],
+    volumes: Optional[Dict[str, str]],
+    detach: bool
+) -> Dict[str, Any]:
+    """Docker SDK arguments shared by create_container and run_container."""
+    return {
+        "image": image,
+        "name": name,
+        "command": command,
+        # The SDK takes {"8080/tcp": "80"} as-is
+        "ports": ports or None,
+        "environment": environment,
+        "volumes": _volume_bindings(volumes),
+        "detach": detach
+    }
 
 @mcp.tool()
+@_tool("creating container")
+@_invalidates_results
 async def create_container(
     image: str,
     name: Optional[str] = None,
@@ -85,35 +264,16 @@ async def create_container(
     Returns:
         Container ID or error message.
     """
-    try:
-        # Prepare port bindings in Docker SDK format
-        port_bindings = {}
-        if ports:
-            for container_port, host_port in ports.items():
-                port_bindings[container_port] = host_port
-        
-        # Prepare volume bindings in Docker SDK format
-        volume_bindings = {}
-        if volumes:
-            for host_vol, container_vol in volumes.items():
-                volume_bindings[host_vol] = {"bind": container_vol, "mode": "rw"}
-        
-        container = docker_client.containers.create(
-            image=image,
-            name=name,
-            command=command,
-            ports=port_bindings,
-            environment=environment,
-            volumes=volume_bindings,
-            detach=detach
-        )
-        
-        return f"Container created successfully with ID: {container.short_id}"
-    except Exception as e:
-        logger.error(f"Error creating container: {e}")
-        return f"Error creating container: {str(e)}"
+    container = await _run(
+        docker_client.containers.create,
+        **_container_args(image, name, command, ports, environment, volumes, detach)
+    )
+
+    return f"Container created successfully with ID: {container.short_id}"
 
 @mcp.tool()
+@_tool("running container")
+@_invalidates_results
 async def run_container(
     image: str,
     name: Optional[str] = None,
@@ -137,35 +297,16 @@ async def run_container(
     Returns:
         Container ID or error message.
     """
-    try:
-        # Prepare port bindings in Docker SDK format
-        port_bindings = {}
-        if ports:
-            for container_port, host_port in ports.items():
-                port_bindings[container_port] = host_port
-        
-        # Prepare volume bindings in Docker SDK format
-        volume_bindings = {}
-        if volumes:
-            for host_vol, container_vol in volumes.items():
-                volume_bindings[host_vol] = {"bind": container_vol, "mode": "rw"}
-        
-        container = docker_client.containers.run(
-            image=image,
-            name=name,
-            command=command,
-            ports=port_bindings,
-            environment=environment,
-            volumes=volume_bindings,
-            detach=detach
-        )
-        
-        return f"Container started successfully with ID: {container.short_id}"
-    except Exception as e:
-        logger.error(f"Error running container: {e}")
-        return f"Error running container: {str(e)}"
+    container = await _run(
+        docker_client.containers.run,
+        **_container_args(image, name, command, ports, environment, volumes, detach)
+    )
+
+    return f"Container started successfully with ID: {container.short_id}"
 
 @mcp.tool()
+@_tool("recreating container")
+@_invalidates_results
 async def recreate_container(container_id: str, start: bool = True) -> str:
     """Recreate a container with the same settings.
     
@@ -176,68 +317,67 @@ async def recreate_container(container_id: str, start: bool = True) -> str:
     Returns:
         New container ID or error message.
     """
-    try:
-        # Get the container
-        container = docker_client.containers.get(container_id)
-        
-        # Get container configuration
-        config = container.attrs
-        
-        # Extract key configuration elements
-        image = config["Config"]["Image"]
-        name = config["Name"].lstrip("/")  # Remove leading slash
-        command = config["Config"]["Cmd"]
-        env = config["Config"]["Env"]
-        
-        # Convert environment variables to dictionary
-        environment = {}
-        if env:
-            for env_var in env:
-                if "=" in env_var:
-                    key, value = env_var.split("=", 1)
-                    environment[key] = value
-        
-        # Extract ports mapping
-        ports = {}
-        if config["HostConfig"]["PortBindings"]:
-            for container_port, host_bindings in config["HostConfig"]["PortBindings"].items():
-                if host_bindings:
-                    # Use the first binding
-                    ports[container_port] = host_bindings[0]["HostPort"]
-        
-        # Extract volume mappings
-        volumes = {}
-        if config["HostConfig"]["Binds"]:
-            for binding in config["HostConfig"]["Binds"]:
-                host_path, container_path = binding.split(":", 1)
-                volumes[host_path] = container_path
-        
-        # Remove the old container
-        container.remove(force=True)
-        
-        # Create a new container with the same configuration
-        new_container = docker_client.containers.create(
-            image=image,
-            name=name,
-            command=command,
-            environment=environment,
-            ports=ports,
-            volumes=volumes
-        )
-        
-        # Start the container if requested
-        if start:
-            new_container.start()
-            status = "started"
-        else:
-            status = "created"
-        
-        return f"Container recreated and {status} with ID: {new_container.short_id}"
-    except Exception as e:
-        logger.error(f"Error recreating container: {e}")
-        return f"Error recreating container: {str(e)}"
+    # Get the container
+    container = await _run(docker_client.containers.get, container_id)
+
+    # Get container configuration
+    config = container.attrs
+
+    # Extract key configuration elements
+    image = config["Config"]["Image"]
+    name = _container_name(config["Name"])
+    command = config["Config"]["Cmd"]
+    env = config["Config"]["Env"]
+
+    # Convert environment variables to dictionary
+    environment = {
+        key: value
+        for env_var in env or ()
+        for key, sep, value in [env_var.partition("=")]
+        if sep
+    }
+
+    # Extract ports mapping, using the first binding of each port
+    ports = {
+        container_port: host_bindings[0]["HostPort"]
+        for container_port, host_bindings in (config["HostConfig"]["PortBindings"] or {}).items()
+        if host_bindings
+    }
+
+    # Extract volume mappings
+    volumes = {
+        host_path: container_path
+        for binding in config["HostConfig"]["Binds"] or ()
+        for host_path, _, container_path in [binding.partition(":")]
+    }
+
+    # Remove the old container
+    await _run(container.remove, force=True)
+    _forget(_container_handles, container)
+
+    # Create a new container with the same configuration
+    new_container = await _run(
+        docker_client.containers.create,
+        image=image,
+        name=name,
+        command=command,
+        environment=environment,
+        ports=ports,
+        volumes=_volume_bindings(volumes)
+    )
+
+    # Start the container if requested
+    if start:
+        await _run(new_container.start)
+        status = "started"
+    else:
+        status = "created"
+
+    return f"Container recreated and {status} with ID: {new_container.short_id}"
 
 @mcp.tool()
+@_tool("starting container")
+@_invalidates_results
 async def start_container(container_id: str) -> str:
     """Start a stopped container.
     
@@ -247,15 +387,20 @@ async def start_container(container_id: str) -> str:
     Returns:
         Success message or error message.
     """
-    try:
-        container = docker_client.containers.get(container_id)
-        container.start()
-        return f"Container {container_id} started successfully"
-    except Exception as e:
-        logger.error(f"Error starting container: {e}")
-        return f"Error starting container: {str(e)}"
+    container = await _run(_get_container, container_id)
+    await _run(container.start)
+    return f"Container {container_id} started successfully"
+
+def _read_logs(container: Any, tail: int) -> str:
+    """Read a container's logs chunk by chunk and decode them once at the end."""
+    buf = bytearray()
+    # stream=True would follow the log by default, stop at the current end instead
+    for chunk in container.logs(tail=tail, stream=True, follow=False):
+        buf.extend(chunk)
+    return buf.decode('utf-8', errors='replace')
 
 @mcp.tool()
+@_tool("fetching container logs")
 async def fetch_container_logs(container_id: str, tail: int = 100) -> str:
     """Fetch logs from a container.
     
@@ -266,15 +411,13 @@ async def fetch_container_logs(container_id: str, tail: int = 100) -> str:
     Returns:
         Container logs or error message.
     """
-    try:
-        container = docker_client.containers.get(container_id)
-        logs = container.logs(tail=tail).decode('utf-8')
-        return logs if logs else "No logs available"
-    except Exception as e:
-        logger.error(f"Error fetching container logs: {e}")
-        return f"Error fetching container logs: {str(e)}"
+    container = await _run(_get_container, container_id)
+    logs = await _run(_read_logs, container, tail)
+    return logs if logs else "No logs available"
 
 @mcp.tool()
+@_tool("stopping container")
+@_invalidates_results
 async def stop_container(container_id: str, timeout: int = 10) -> str:
     """Stop a running container.
     
@@ -285,15 +428,13 @@ async def stop_container(container_id: str, timeout: int = 10) -> str:
     Returns:
         Success message or error message.
     """
-    try:
-        container = docker_client.containers.get(container_id)
-        container.stop(timeout=timeout)
-        return f"Container {container_id} stopped successfully"
-    except Exception as e:
-        logger.error(f"Error stopping container: {e}")
-        return f"Error stopping container: {str(e)}"
+    container = await _run(_get_container, container_id)
+    await _run(container.stop, timeout=timeout)
+    return f"Container {container_id} stopped successfully"
 
 @mcp.tool()
+@_tool("removing container")
+@_invalidates_results
 async def remove_container(container_id: str, force: bool = False) -> str:
     """Remove a container.
     
@@ -304,44 +445,47 @@ async def remove_container(container_id: str, force: bool = False) -> str:
     Returns:
         Success message or error message.
     """
-    try:
-        container = docker_client.containers.get(container_id)
-        container.remove(force=force)
-        return f"Container {container_id} removed successfully"
-    except Exception as e:
-        logger.error(f"Error removing container: {e}")
-        return f"Error removing container: {str(e)}"
+    container = await _run(_get_container, container_id)
+    await _run(container.remove, force=force)
+    _forget(_container_handles, container)
+    return f"Container {container_id} removed successfully"
 
 #
 # Image Tools
 #
 
+def _image_summary(image: Dict[str, Any], tags: List[str]) -> Dict[str, Any]:
+    """Summarize a raw /images/json entry."""
+    size = image["Size"]
+    # Size in hundredths of a MB, rounded half up
+    centi_mb = (size + 5_000) // 10_000
+    return {
+        "id": image["Id"][:19],
+        "tags": tags or ["<none>"],
+        "size": f"{centi_mb // 100}.{centi_mb % 100:02d} MB",
+        "size_bytes": size,
+        "created": _timestamp(image["Created"])
+    }
+
 @mcp.tool()
+@_tool("listing images")
+@_cached_result
 async def list_images() -> str:
     """List all available Docker images.
     
     Returns:
         String representation of images list.
     """
-    try:
-        images = docker_client.images.list()
-        image_list = []
-        
-        for image in images:
-            tags = image.tags if image.tags else ["<none>"]
-            image_list.append({
-                "id": image.short_id,
-                "tags": tags,
-                "size": f"{image.attrs['Size'] / 1000000:.2f} MB",
-                "created": image.attrs["Created"]
-            })
-        
-        return json.dumps(image_list, indent=2)
-    except Exception as e:
-        logger.error(f"Error listing images: {e}")
-        return f"Error listing images: {str(e)}"
+    # The raw listing has every field needed; images.list() would inspect each image
+    images = await _run(docker_client.api.images)
+    image_tags = _image_tags(images)
+    image_list = [_image_summary(image, image_tags[image["Id"]]) for image in images]
+
+    return _dumps(image_list)
 
 @mcp.tool()
+@_tool("pulling image")
+@_invalidates_results
 async def pull_image(image_name: str, tag: str = "latest") -> str:
     """Pull a Docker image from a registry.
     
@@ -352,15 +496,12 @@ async def pull_image(image_name: str, tag: str = "latest") -> str:
     Returns:
         Success message or error message.
     """
-    try:
-        full_name = f"{image_name}:{tag}"
-        docker_client.images.pull(image_name, tag=tag)
-        return f"Image {full_name} pulled successfully"
-    except Exception as e:
-        logger.error(f"Error pulling image: {e}")
-        return f"Error pulling image: {str(e)}"
+    full_name = f"{image_name}:{tag}"
+    await _run(docker_client.images.pull, image_name, tag=tag)
+    return f"Image {full_name} pulled successfully"
 
 @mcp.tool()
+@_tool("pushing image")
 async def push_image(image_name: str, tag: str = "latest") -> str:
     """Push a Docker image to a registry.
     
@@ -371,21 +512,39 @@ async def push_image(image_name: str, tag: str = "latest") -> str:
     Returns:
         Success message or error message.
     """
-    try:
-        full_name = f"{image_name}:{tag}"
-        auth_config = {}  # Add auth configuration if needed
-        
-        # This returns a generator that produces push progress
-        for line in docker_client.images.push(image_name, tag=tag, stream=True, decode=True, auth_config=auth_config):
-            # We could process the stream but for now we'll just ignore it
-            pass
-            
-        return f"Image {full_name} pushed successfully"
-    except Exception as e:
-        logger.error(f"Error pushing image: {e}")
-        return f"Error pushing image: {str(e)}"
+    full_name = f"{image_name}:{tag}"
+    auth_config = {}  # Add auth configuration if needed
+
+    # Read the progress output in one piece; only its last line says whether the push worked
+    output = await _run(docker_client.api.push, image_name, tag=tag, auth_config=auth_config)
+    last = orjson.loads(output.rstrip().rpartition("\n")[2] or "{}")
+    if "error" in last:
+        raise docker.errors.APIError(last["error"])
+
+    return f"Image {full_name} pushed successfully"
+
+# Builders that do not send an aux ID message name the image in their output
+_BUILT_IMAGE = re.compile(r"(^Successfully built |sha256:)([0-9a-f]+)$")
+
+def _build(**kwargs: Any) -> str:
+    """Run a build, consuming its output as it streams, and return the image ID."""
+    image_id = None
+    for chunk in docker_client.api.build(decode=True, **kwargs):
+        if "error" in chunk:
+            raise docker.errors.BuildError(chunk["error"], ())
+        if "aux" in chunk:
+            image_id = chunk["aux"].get("ID", image_id)
+        elif "stream" in chunk:
+            match = _BUILT_IMAGE.search(chunk["stream"])
+            if match:
+                image_id = image_id or match.group(2)
+    if image_id is None:
+        raise docker.errors.BuildError("no image ID in build output", ())
+    return image_id
 
 @mcp.tool()
+@_tool("building image")
+@_invalidates_results
 async def build_image(
     path: str,
     tag: str,
@@ -405,26 +564,26 @@ async def build_image(
     Returns:
         Success message or error message.
     """
-    try:
-        # Check if path exists
-        if not os.path.exists(path):
-            return f"Error: Path {path} does not exist"
-        
-        # Build the image
-        image, logs = docker_client.images.build(
-            path=path,
-            tag=tag,
-            dockerfile=dockerfile,
-            rm=rm,
-            nocache=nocache
-        )
-        
-        return f"Image built successfully with ID: {image.short_id}"
-    except Exception as e:
-        logger.error(f"Error building image: {e}")
-        return f"Error building image: {str(e)}"
+    # Check if path exists
+    if not os.path.exists(path):
+        return f"Error: Path {path} does not exist"
+
+    # Build the image
+    image_id = await _run(
+        _build,
+        path=path,
+        tag=tag,
+        dockerfile=dockerfile,
+        rm=rm,
+        nocache=nocache
+    )
+    short_id = image_id[:19] if image_id.startswith("sha256:") else image_id[:12]
+
+    return f"Image built successfully with ID: {short_id}"
 
 @mcp.tool()
+@_tool("removing image")
+@_invalidates_results
 async def remove_image(image_id: str, force: bool = False) -> str:
     """Remove a Docker image.
     
@@ -435,43 +594,40 @@ async def remove_image(image_id: str, force: bool = False) -> str:
     Returns:
         Success message or error message.
     """
-    try:
-        docker_client.images.remove(image_id, force=force)
-        return f"Image {image_id} removed successfully"
-    except Exception as e:
-        logger.error(f"Error removing image: {e}")
-        return f"Error removing image: {str(e)}"
+    await _run(docker_client.images.remove, image_id, force=force)
+    return f"Image {image_id} removed successfully"
 
 #
 # Network Tools
 #
 
+def _network_summary(network: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize a raw /networks entry."""
+    return {
+        "id": network["Id"][:12],
+        "name": network["Name"],
+        "driver": network["Driver"],
+        "scope": network["Scope"],
+        "containers": tuple(network.get("Containers") or ())
+    }
+
 @mcp.tool()
+@_tool("listing networks")
+@_cached_result
 async def list_networks() -> str:
     """List all Docker networks.
     
     Returns:
         String representation of networks list.
     """
-    try:
-        networks = docker_client.networks.list()
-        network_list = []
-        
-        for network in networks:
-            network_list.append({
-                "id": network.short_id,
-                "name": network.name,
-                "driver": network.attrs["Driver"],
-                "scope": network.attrs["Scope"],
-                "containers": list(network.attrs["Containers"].keys()) if "Containers" in network.attrs else []
-            })
-        
-        return json.dumps(network_list, indent=2)
-    except Exception as e:
-        logger.error(f"Error listing networks: {e}")
-        return f"Error listing networks: {str(e)}"
+    networks = await _run(docker_client.api.networks)
+    network_list = [_network_summary(network) for network in networks]
+
+    return _dumps(network_list)
 
 @mcp.tool()
+@_tool("creating network")
+@_invalidates_results
 async def create_network(
     name: str,
     driver: str = "bridge",
@@ -489,19 +645,18 @@ async def create_network(
     Returns:
         Success message or error message.
     """
-    try:
-        network = docker_client.networks.create(
-            name=name,
-            driver=driver,
-            internal=internal,
-            labels=labels
-        )
-        return f"Network created successfully with ID: {network.short_id}"
-    except Exception as e:
-        logger.error(f"Error creating network: {e}")
-        return f"Error creating network: {str(e)}"
+    network = await _run(
+        docker_client.networks.create,
+        name=name,
+        driver=driver,
+        internal=internal,
+        labels=labels
+    )
+    return f"Network created successfully with ID: {network.short_id}"
 
 @mcp.tool()
+@_tool("removing network")
+@_invalidates_results
 async def remove_network(network_id: str) -> str:
     """Remove a Docker network.
     
@@ -511,43 +666,41 @@ async def remove_network(network_id: str) -> str:
     Returns:
         Success message or error message.
     """
-    try:
-        network = docker_client.networks.get(network_id)
-        network.remove()
-        return f"Network {network_id} removed successfully"
-    except Exception as e:
-        logger.error(f"Error removing network: {e}")
-        return f"Error removing network: {str(e)}"
+    network = await _run(_get_network, network_id)
+    await _run(network.remove)
+    _forget(_network_handles, network)
+    return f"Network {network_id} removed successfully"
 
 #
 # Volume Tools
 #
 
+def _volume_summary(volume: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize a raw /volumes entry."""
+    return {
+        "name": volume["Name"],
+        "driver": volume["Driver"],
+        "mountpoint": volume["Mountpoint"],
+        "created": volume["CreatedAt"]
+    }
+
 @mcp.tool()
+@_tool("listing volumes")
+@_cached_result
 async def list_volumes() -> str:
     """List all Docker volumes.
     
     Returns:
         String representation of volumes list.
     """
-    try:
-        volumes = docker_client.volumes.list()
-        volume_list = []
-        
-        for volume in volumes:
-            volume_list.append({
-                "name": volume.name,
-                "driver": volume.attrs["Driver"],
-                "mountpoint": volume.attrs["Mountpoint"],
-                "created": volume.attrs["CreatedAt"]
-            })
-        
-        return json.dumps(volume_list, indent=2)
-    except Exception as e:
-        logger.error(f"Error listing volumes: {e}")
-        return f"Error listing volumes: {str(e)}"
+    volumes = (await _run(docker_client.api.volumes))["Volumes"] or []
+    volume_list = [_volume_summary(volume) for volume in volumes]
+
+    return _dumps(volume_list)
 
 @mcp.tool()
+@_tool("creating volume")
+@_invalidates_results
 async def create_volume(
     name: str,
     driver: str = "local",
@@ -563,19 +716,18 @@ async def create_volume(
     Returns:
         Success message or error message.
     """
-    try:
-        volume = docker_client.volumes.create(
-            name=name,
-            driver=driver,
-            labels=labels
-        )
-        
-        return f"Volume created successfully"
-    except Exception as e:
-        logger.error(f"Error creating volume: {e}")
-        return f"Error creating volume: {str(e)}"
+    volume = await _run(
+        docker_client.volumes.create,
+        name=name,
+        driver=driver,
+        labels=labels
+    )
+
+    return f"Volume created successfully"
 
 @mcp.tool()
+@_tool("removing volume")
+@_invalidates_results
 async def remove_volume(volume_name: str, force: bool = False) -> str:
     """Remove a Docker volume.
     
@@ -586,13 +738,40 @@ async def remove_volume(volume_name: str, force: bool = False) -> str:
     Returns:
         Success message or error message.
     """
-    try:
-        volume = docker_client.volumes.get(volume_name)
-        volume.remove(force=force)
-        return f"Volume {volume_name} removed successfully"
-    except Exception as e:
-        logger.error(f"Error removing volume: {e}")
-        return f"Error removing volume: {str(e)}"
+    volume = await _run(_get_volume, volume_name)
+    await _run(volume.remove, force=force)
+    _forget(_volume_handles, volume)
+    return f"Volume {volume_name} removed successfully"
+
+#
+# Overview Tools
+#
+
+@mcp.tool()
+@_tool("describing Docker host")
+@_cached_result
+async def describe_all() -> str:
+    """List all containers, images, networks, and volumes in one call.
+    
+    Returns:
+        String representation of a mapping with "containers", "images",
+        "networks", and "volumes" lists, in the same format as the list_* tools.
+    """
+    # The four listings are independent, so they go to the daemon together
+    containers, images, networks, volumes = await asyncio.gather(
+        _run(docker_client.api.containers, all=True),
+        _run(docker_client.api.images),
+        _run(docker_client.api.networks),
+        _run(docker_client.api.volumes)
+    )
+    image_tags = _image_tags(images)
+
+    return _dumps({
+        "containers": [_container_summary(container, image_tags) for container in containers],
+        "images": [_image_summary(image, image_tags[image["Id"]]) for image in images],
+        "networks": [_network_summary(network) for network in networks],
+        "volumes": [_volume_summary(volume) for volume in volumes["Volumes"] or ()]
+    })
 
 if __name__ == "__main__":
     # Run the server
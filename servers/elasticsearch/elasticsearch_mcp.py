@@ -1,35 +1,39 @@
 from mcp.server.fastmcp import FastMCP
 import httpx
 import os
-import json
+import asyncio
+import functools
 import logging
+import orjson
+from urllib.parse import urlencode, quote
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 load_dotenv()
 
-from typing import Optional, Dict, List, Any, Union, Literal, ClassVar
-from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict, ValidationError
+from typing import Optional, Dict, List, Any, Union, Literal, AsyncIterator
+from typing_extensions import TypedDict, NotRequired, Annotated
+from pydantic import BaseModel, Field, ConfigDict, ValidationError, TypeAdapter, with_config
 
 # Base models
 class BaseElasticsearchModel(BaseModel):
     """Base model for all Elasticsearch models."""
-    model_config = ConfigDict(extra="forbid", populate_by_name=True)  # Prevent extra fields, allow aliases
-    
-class EmptyParams(BaseElasticsearchModel):
+    # Schemas are built on first validation, so unused tools cost nothing at import
+    model_config = ConfigDict(extra="forbid", populate_by_name=True, defer_build=True)  # Prevent extra fields, allow aliases
+
+# Parameter models are TypedDicts: validating one checks the arguments without
+# building a model instance. TypedDicts do not inherit config, so each one is
+# decorated with it.
+_PARAMS_CONFIG = ConfigDict(extra="forbid")  # Prevent extra fields
+
+@with_config(_PARAMS_CONFIG)
+class EmptyParams(TypedDict):
     """Empty parameter model for endpoints that don't require parameters."""
-    pass
 
 # Common parameter models
-class RefreshParam(BaseModel):
+@with_config(_PARAMS_CONFIG)
+class RefreshParam(TypedDict):
     """Refresh policy parameter."""
-    refresh: Optional[Literal["true", "false", "wait_for"]] = Field(
-        None, 
-        description="Refresh policy ('true', 'false', 'wait_for')"
-    )
-    
-    # Constants for convenience
-    TRUE: ClassVar[str] = "true"
-    FALSE: ClassVar[str] = "false"
-    WAIT_FOR: ClassVar[str] = "wait_for"
+    refresh: NotRequired[Annotated[Optional[Literal["true", "false", "wait_for"]], Field(description="Refresh policy ('true', 'false', 'wait_for')")]]
 
 # Response models
 class AcknowledgedResponse(BaseElasticsearchModel):
@@ -42,14 +46,12 @@ class ErrorResponse(BaseElasticsearchModel):
     status: int = Field(description="HTTP status code")
 
 # Cluster API models
-class ClusterHealthParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class ClusterHealthParams(TypedDict):
     """Parameters for cluster health API."""
-    index: Optional[str] = Field(None, description="Optional specific index to check health for")
-    timeout: Optional[str] = Field(None, description="Timeout for the health check (e.g., '30s')")
-    level: Optional[Literal["cluster", "indices", "shards"]] = Field(
-        None, 
-        description="Level of health information to report"
-    )
+    index: NotRequired[Annotated[Optional[str], Field(description="Optional specific index to check health for")]]
+    timeout: NotRequired[Annotated[Optional[str], Field(description="Timeout for the health check (e.g., '30s')")]]
+    level: NotRequired[Annotated[Optional[Literal["cluster", "indices", "shards"]], Field(description="Level of health information to report")]]
 
 class ClusterHealthResponse(BaseElasticsearchModel):
     """Cluster health response model."""
@@ -69,26 +71,29 @@ class ClusterHealthResponse(BaseElasticsearchModel):
     task_max_waiting_in_queue_millis: int
     active_shards_percent_as_number: float
 
-class ClusterStatsParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class ClusterStatsParams(TypedDict):
     """Parameters for cluster stats API."""
-    node_id: Optional[str] = Field(None, description="Optional specific node ID to get stats for")
+    node_id: NotRequired[Annotated[Optional[str], Field(description="Optional specific node ID to get stats for")]]
 
-class ClusterSettingsParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class ClusterSettingsParams(TypedDict):
     """Parameters for cluster settings API."""
-    action: Literal["get", "update"] = Field(description="Action to perform: 'get' or 'update'")
-    settings: Optional[Dict[str, Any]] = Field(None, description="Settings to update (required for update action)")
-    include_defaults: bool = Field(False, description="Whether to include default settings in the response")
+    action: Annotated[Literal["get", "update"], Field(description="Action to perform: 'get' or 'update'")]
+    settings: NotRequired[Annotated[Optional[Dict[str, Any]], Field(description="Settings to update (required for update action)")]]
+    include_defaults: NotRequired[Annotated[bool, Field(description="Whether to include default settings in the response")]]
 
 # Search API models
-class SearchParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class SearchParams(TypedDict):
     """Parameters for search API."""
-    index_name: str = Field(description="Name of the index to search in (or comma-separated list of indices)")
-    query: Dict[str, Any] = Field(description="Elasticsearch query DSL object")
-    from_offset: Optional[int] = Field(None, description="Starting offset for results")
-    size: Optional[int] = Field(None, description="Number of hits to return")
-    sort: Optional[List[Union[str, Dict[str, Any]]]] = Field(None, description="Sort criteria")
-    aggs: Optional[Dict[str, Any]] = Field(None, description="Aggregations to perform")
-    source: Optional[Union[bool, List[str]]] = Field(None, description="Control which fields to include in the response")
+    index_name: Annotated[str, Field(description="Name of the index to search in (or comma-separated list of indices)")]
+    query: Annotated[Dict[str, Any], Field(description="Elasticsearch query DSL object")]
+    from_offset: NotRequired[Annotated[Optional[int], Field(description="Starting offset for results")]]
+    size: NotRequired[Annotated[Optional[int], Field(description="Number of hits to return")]]
+    sort: NotRequired[Annotated[Optional[List[Union[str, Dict[str, Any]]]], Field(description="Sort criteria")]]
+    aggs: NotRequired[Annotated[Optional[Dict[str, Any]], Field(description="Aggregations to perform")]]
+    source: NotRequired[Annotated[Optional[Union[bool, List[str]]], Field(description="Control which fields to include in the response")]]
 
 class SearchHit(BaseElasticsearchModel):
     """Single search hit model."""
@@ -97,160 +102,183 @@ class SearchHit(BaseElasticsearchModel):
     score: Optional[float] = Field(None, alias="_score")
     source: Dict[str, Any] = Field(alias="_source")
 
+@with_config(ConfigDict(extra="allow"))  # Keep max_score and any other keys
+class HitsBlock(TypedDict):
+    """The hits section of a search response; total and hits are required."""
+    total: Union[int, Dict[str, Any]]
+    hits: List[Dict[str, Any]]
+
 class SearchResponse(BaseElasticsearchModel):
     """Search response model."""
     took: int = Field(description="Time in milliseconds for Elasticsearch to execute the search")
     timed_out: bool = Field(description="Whether the search timed out")
     shards: Dict[str, Any] = Field(description="Shard information", alias="_shards")
-    hits: Dict[str, Any] = Field(description="Search hits")
-
-    @field_validator("hits")
-    def validate_hits(cls, v):
-        if "total" not in v:
-            raise ValueError("hits must contain total field")
-        if "hits" not in v:
-            raise ValueError("hits must contain hits array")
-        return v
+    hits: HitsBlock = Field(description="Search hits")
 
 # Index API models
-class CreateIndexParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class CreateIndexParams(TypedDict):
     """Parameters for creating an index."""
-    index_name: str = Field(description="Name of the index to create")
-    settings: Optional[Dict[str, Any]] = Field(None, description="Optional index settings")
-    mappings: Optional[Dict[str, Any]] = Field(None, description="Optional index mappings")
-    aliases: Optional[Dict[str, Any]] = Field(None, description="Optional index aliases")
+    index_name: Annotated[str, Field(description="Name of the index to create")]
+    settings: NotRequired[Annotated[Optional[Dict[str, Any]], Field(description="Optional index settings")]]
+    mappings: NotRequired[Annotated[Optional[Dict[str, Any]], Field(description="Optional index mappings")]]
+    aliases: NotRequired[Annotated[Optional[Dict[str, Any]], Field(description="Optional index aliases")]]
 
-class GetIndexParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class GetIndexParams(TypedDict):
     """Parameters for getting index information."""
-    index_name: str = Field(description="Name of the index to get information for")
+    index_name: Annotated[str, Field(description="Name of the index to get information for")]
 
-class DeleteIndexParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class DeleteIndexParams(TypedDict):
     """Parameters for deleting an index."""
-    index_name: str = Field(description="Name of the index to delete")
+    index_name: Annotated[str, Field(description="Name of the index to delete")]
 
-class GetMappingParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class GetMappingParams(TypedDict):
     """Parameters for getting index mapping."""
-    index_name: str = Field(description="Name of the index to get mapping for")
+    index_name: Annotated[str, Field(description="Name of the index to get mapping for")]
 
-class UpdateMappingParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class UpdateMappingParams(TypedDict):
     """Parameters for updating index mapping."""
-    index_name: str = Field(description="Name of the index to update mapping for")
-    properties: Dict[str, Any] = Field(description="Mapping properties to update")
+    index_name: Annotated[str, Field(description="Name of the index to update mapping for")]
+    properties: Annotated[Dict[str, Any], Field(description="Mapping properties to update")]
 
-class ListIndicesParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class ListIndicesParams(TypedDict):
     """Parameters for listing indices."""
-    pattern: Optional[str] = Field(None, description="Optional pattern to filter indices (e.g., 'log-*')")
+    pattern: NotRequired[Annotated[Optional[str], Field(description="Optional pattern to filter indices (e.g., 'log-*')")]]
 
 # Document API models
-class IndexDocumentParams(BaseElasticsearchModel, RefreshParam):
+@with_config(_PARAMS_CONFIG)
+class IndexDocumentParams(RefreshParam):
     """Parameters for indexing a document."""
-    index_name: str = Field(description="Name of the index")
-    document: Dict[str, Any] = Field(description="Document data")
-    id: Optional[str] = Field(None, description="Optional document ID (if not provided, one will be generated)")
+    index_name: Annotated[str, Field(description="Name of the index")]
+    document: Annotated[Dict[str, Any], Field(description="Document data")]
+    id: NotRequired[Annotated[Optional[str], Field(description="Optional document ID (if not provided, one will be generated)")]]
 
-class GetDocumentParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class GetDocumentParams(TypedDict):
     """Parameters for getting a document."""
-    index_name: str = Field(description="Name of the index")
-    id: str = Field(description="Document ID")
-    source_includes: Optional[str] = Field(None, description="Comma-separated list of fields to include in the source")
-    source_excludes: Optional[str] = Field(None, description="Comma-separated list of fields to exclude from the source")
+    index_name: Annotated[str, Field(description="Name of the index")]
+    id: Annotated[str, Field(description="Document ID")]
+    source_includes: NotRequired[Annotated[Optional[str], Field(description="Comma-separated list of fields to include in the source")]]
+    source_excludes: NotRequired[Annotated[Optional[str], Field(description="Comma-separated list of fields to exclude from the source")]]
 
-class DeleteDocumentParams(BaseElasticsearchModel, RefreshParam):
+@with_config(_PARAMS_CONFIG)
+class DeleteDocumentParams(RefreshParam):
     """Parameters for deleting a document."""
-    index_name: str = Field(description="Name of the index")
-    id: str = Field(description="Document ID")
+    index_name: Annotated[str, Field(description="Name of the index")]
+    id: Annotated[str, Field(description="Document ID")]
 
-class BulkOperationParams(BaseElasticsearchModel, RefreshParam):
+@with_config(_PARAMS_CONFIG)
+class BulkOperationParams(RefreshParam):
     """Parameters for bulk operations."""
-    operations: str = Field(description="Bulk operations in NDJSON format (each action and source doc on a new line)")
-    index_name: Optional[str] = Field(None, description="Optional default index name")
+    operations: Annotated[str, Field(description="Bulk operations in NDJSON format (each action and source doc on a new line)")]
+    index_name: NotRequired[Annotated[Optional[str], Field(description="Optional default index name")]]
 
 # Simple search model
-class SimpleSearchParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class SimpleSearchParams(TypedDict):
     """Parameters for simple search API."""
-    index_name: str = Field(description="Name of the index to search in (or comma-separated list of indices)")
-    keyword: str = Field(description="Search keyword or phrase")
-    field: Optional[str] = Field(None, description="Field to search in (omit for full-text search across all fields)")
-    size: int = Field(10, description="Number of hits to return (default: 10)")
-    from_offset: int = Field(0, description="Starting offset for results (default: 0)")
-    exact_match: bool = Field(False, description="Whether to perform an exact match (term query) or fuzzy match (default: False)")
-
-class CountDocumentsParams(BaseElasticsearchModel):
+    index_name: Annotated[str, Field(description="Name of the index to search in (or comma-separated list of indices)")]
+    keyword: Annotated[str, Field(description="Search keyword or phrase")]
+    field: NotRequired[Annotated[Optional[str], Field(description="Field to search in (omit for full-text search across all fields)")]]
+    size: NotRequired[Annotated[int, Field(description="Number of hits to return (default: 10)")]]
+    from_offset: NotRequired[Annotated[int, Field(description="Starting offset for results (default: 0)")]]
+    exact_match: NotRequired[Annotated[bool, Field(description="Whether to perform an exact match (term query) or fuzzy match (default: False)")]]
+
+@with_config(_PARAMS_CONFIG)
+class CountDocumentsParams(TypedDict):
     """Parameters for counting documents."""
-    index_name: str = Field(description="Name of the index (or comma-separated list of indices)")
-    query: Optional[Dict[str, Any]] = Field(None, description="Elasticsearch query DSL object (omit to count all documents)")
+    index_name: Annotated[str, Field(description="Name of the index (or comma-separated list of indices)")]
+    query: NotRequired[Annotated[Optional[Dict[str, Any]], Field(description="Elasticsearch query DSL object (omit to count all documents)")]]
 
-class MultiSearchParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class MultiSearchParams(TypedDict):
     """Parameters for multi-search API."""
-    searches: List[Dict[str, Any]] = Field(description="Array of search requests, each containing 'index', 'query' and optional 'from', 'size' parameters")
+    searches: Annotated[List[Dict[str, Any]], Field(description="Array of search requests, each containing 'index', 'query' and optional 'from', 'size' parameters")]
 
 # Ingest API models
-class CreatePipelineParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class CreatePipelineParams(TypedDict):
     """Parameters for creating an ingest pipeline."""
-    pipeline_id: str = Field(description="ID of the pipeline")
-    processors: List[Dict[str, Any]] = Field(description="Array of processor definitions")
-    description: Optional[str] = Field(None, description="Description of the pipeline")
+    pipeline_id: Annotated[str, Field(description="ID of the pipeline")]
+    processors: Annotated[List[Dict[str, Any]], Field(description="Array of processor definitions")]
+    description: NotRequired[Annotated[Optional[str], Field(description="Description of the pipeline")]]
 
-class GetPipelineParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class GetPipelineParams(TypedDict):
     """Parameters for getting an ingest pipeline."""
-    pipeline_id: Optional[str] = Field(None, description="ID of the pipeline (omit to get all pipelines)")
+    pipeline_id: NotRequired[Annotated[Optional[str], Field(description="ID of the pipeline (omit to get all pipelines)")]]
 
-class DeletePipelineParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class DeletePipelineParams(TypedDict):
     """Parameters for deleting an ingest pipeline."""
-    pipeline_id: str = Field(description="ID of the pipeline to delete")
+    pipeline_id: Annotated[str, Field(description="ID of the pipeline to delete")]
 
-class SimulatePipelineParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class SimulatePipelineParams(TypedDict):
     """Parameters for simulating an ingest pipeline."""
-    documents: List[Dict[str, Any]] = Field(description="Documents to process through the pipeline")
-    pipeline_id: Optional[str] = Field(None, description="ID of an existing pipeline to simulate (omit if providing inline definition)")
-    pipeline: Optional[Dict[str, Any]] = Field(None, description="Inline pipeline definition")
-    verbose: bool = Field(False, description="Return verbose results")
+    documents: Annotated[List[Dict[str, Any]], Field(description="Documents to process through the pipeline")]
+    pipeline_id: NotRequired[Annotated[Optional[str], Field(description="ID of an existing pipeline to simulate (omit if providing inline definition)")]]
+    pipeline: NotRequired[Annotated[Optional[Dict[str, Any]], Field(description="Inline pipeline definition")]]
+    verbose: NotRequired[Annotated[bool, Field(description="Return verbose results")]]
 
 # Info API models
-class NodeInfoParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class NodeInfoParams(TypedDict):
     """Parameters for node info API."""
-    node_id: Optional[str] = Field(None, description="Optional specific node ID (omit for all nodes)")
-    metrics: Optional[str] = Field(None, description="Comma-separated list of metrics to retrieve (e.g., 'jvm,os,process')")
+    node_id: NotRequired[Annotated[Optional[str], Field(description="Optional specific node ID (omit for all nodes)")]]
+    metrics: NotRequired[Annotated[Optional[str], Field(description="Comma-separated list of metrics to retrieve (e.g., 'jvm,os,process')")]]
 
-class NodeStatsParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class NodeStatsParams(TypedDict):
     """Parameters for node stats API."""
-    node_id: Optional[str] = Field(None, description="Optional specific node ID (omit for all nodes)")
-    metrics: Optional[str] = Field(None, description="Comma-separated list of metrics to retrieve (e.g., 'jvm,os,process')")
-    index_metrics: Optional[str] = Field(None, description="Comma-separated list of index metrics to retrieve")
+    node_id: NotRequired[Annotated[Optional[str], Field(description="Optional specific node ID (omit for all nodes)")]]
+    metrics: NotRequired[Annotated[Optional[str], Field(description="Comma-separated list of metrics to retrieve (e.g., 'jvm,os,process')")]]
+    index_metrics: NotRequired[Annotated[Optional[str], Field(description="Comma-separated list of index metrics to retrieve")]]
 
-class CatIndicesParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class CatIndicesParams(TypedDict):
     """Parameters for cat indices API."""
-    format: str = Field("json", description="Output format (default: json)")
-    verbose: bool = Field(True, description="Include column headers")
-    headers: Optional[str] = Field(None, description="Comma-separated list of headers to include")
+    format: NotRequired[Annotated[str, Field(description="Output format (default: json)")]]
+    verbose: NotRequired[Annotated[bool, Field(description="Include column headers")]]
+    headers: NotRequired[Annotated[Optional[str], Field(description="Comma-separated list of headers to include")]]
 
-class CatNodesParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class CatNodesParams(TypedDict):
     """Parameters for cat nodes API."""
-    format: str = Field("json", description="Output format (default: json)")
-    verbose: bool = Field(True, description="Include column headers")
-    headers: Optional[str] = Field(None, description="Comma-separated list of headers to include")
+    format: NotRequired[Annotated[str, Field(description="Output format (default: json)")]]
+    verbose: NotRequired[Annotated[bool, Field(description="Include column headers")]]
+    headers: NotRequired[Annotated[Optional[str], Field(description="Comma-separated list of headers to include")]]
 
-class CatAliasesParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class CatAliasesParams(TypedDict):
     """Parameters for cat aliases API."""
-    format: str = Field("json", description="Output format (default: json)")
-    verbose: bool = Field(True, description="Include column headers")
+    format: NotRequired[Annotated[str, Field(description="Output format (default: json)")]]
+    verbose: NotRequired[Annotated[bool, Field(description="Include column headers")]]
 
 # Template API models
-class CreateIndexTemplateParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class CreateIndexTemplateParams(TypedDict):
     """Parameters for creating an index template."""
-    name: str = Field(description="Name of the template")
-    index_patterns: List[str] = Field(description="List of index patterns this template applies to")
-    template: Dict[str, Any] = Field(description="Template definition with settings, mappings, etc.")
-    version: Optional[int] = Field(None, description="Optional version number")
-    priority: Optional[int] = Field(None, description="Optional priority (higher takes precedence)")
-
-class GetIndexTemplateParams(BaseElasticsearchModel):
+    name: Annotated[str, Field(description="Name of the template")]
+    index_patterns: Annotated[List[str], Field(description="List of index patterns this template applies to")]
+    template: Annotated[Dict[str, Any], Field(description="Template definition with settings, mappings, etc.")]
+    version: NotRequired[Annotated[Optional[int], Field(description="Optional version number")]]
+    priority: NotRequired[Annotated[Optional[int], Field(description="Optional priority (higher takes precedence)")]]
+
+@with_config(_PARAMS_CONFIG)
+class GetIndexTemplateParams(TypedDict):
     """Parameters for getting an index template."""
-    name: Optional[str] = Field(None, description="Name of the template to get (omit for all templates)")
+    name: NotRequired[Annotated[Optional[str], Field(description="Name of the template to get (omit for all templates)")]]
 
-class DeleteIndexTemplateParams(BaseElasticsearchModel):
+@with_config(_PARAMS_CONFIG)
+class DeleteIndexTemplateParams(TypedDict):
     """Parameters for deleting an index template."""
-    name: str = Field(description="Name of the template to delete")
+    name: Annotated[str, Field(description="Name of the template to delete")]
 
 
 # Configure logging
@@ -261,11 +289,64 @@ logger = logging.getLogger("elk-mcp-server")
 ELK_BASE_URL = os.getenv("ELASTICSEARCH_BASE_URL")
 ELK_TOKEN = os.getenv("ELASTICSEARCH_TOKEN")
 
+# Shared client for all calls to Elasticsearch, so requests reuse pooled connections
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _get_http() -> httpx.AsyncClient:
+    """Return the shared httpx client, creating it on first use.
+    
+    Pooled connections belong to the event loop that opened them, so the
+    client is rebuilt if the tools are later driven from another loop.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client_loop is not loop:
+        _http_client_loop = loop
+        _http_client = httpx.AsyncClient(
+            base_url=ELK_BASE_URL or "",
+            headers={"Authorization": f"ApiKey {ELK_TOKEN}"} if ELK_TOKEN else None,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=True,
+            timeout=30.0
+        )
+    return _http_client
+
+async def close_http_client() -> None:
+    """Close the shared httpx client if it was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+# Server sessions currently sharing the HTTP client
+_lifespan_refs = 0
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Detect serverless mode at startup, and close the shared HTTP client after the last session ends."""
+    global _lifespan_refs
+    _lifespan_refs += 1
+    # Probe in the background so the first tool call does not wait for it
+    probe = asyncio.create_task(check_serverless_mode())
+    try:
+        yield
+    finally:
+        probe.cancel()
+        _lifespan_refs -= 1
+        if _lifespan_refs == 0:
+            await close_http_client()
+
 # Create MCP server instance
-mcp = FastMCP("elk-mcp-server")
+mcp = FastMCP("elk-mcp-server", lifespan=server_lifespan)
+
+# Index settings that Elasticsearch Serverless manages itself and rejects
+SERVERLESS_UNSUPPORTED_SETTINGS = frozenset({"number_of_shards", "number_of_replicas"})
 
-# Track if we're in serverless mode
-is_serverless = None
+# Whether we're in serverless mode, once detected
+_serverless: Optional[bool] = None
+# Makes concurrent first calls share a single detection request
+_serverless_lock = asyncio.Lock()
 
 # Helper function to make requests to Elasticsearch
 async def make_elk_request(
@@ -274,49 +355,30 @@ async def make_elk_request(
     body: Any = None,
     content_type: str = "application/json"
 ) -> Any:
-    url = f"{ELK_BASE_URL}{path}"
-    
-    headers = {
-        "Content-Type": content_type,
-    }
-    
-    # Add token authentication if provided
-    if ELK_TOKEN:
-        headers["Authorization"] = f"ApiKey {ELK_TOKEN}"
-    
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if method == "GET":
-                response = await client.get(url, headers=headers)
-            elif method == "POST":
-                if content_type == "application/x-ndjson":
-                    response = await client.post(url, headers=headers, content=body)
-                else:
-                    response = await client.post(url, headers=headers, json=body if body else None)
-            elif method == "PUT":
-                response = await client.put(url, headers=headers, json=body if body else None)
-            elif method == "DELETE":
-                response = await client.delete(url, headers=headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            # Store status for potential error reporting
-            status = response.status_code
-            
-            # Parse the response
-            response_text = response.text
-            
-            try:
-                response_data = response.json()
-            except Exception:
-                response_data = response_text
-            
-            # Check if response is OK (2xx status code)
-            if 200 <= status < 300:
-                return response_data
-            else:
-                error_message = f"Elasticsearch error: {status} - {response_data}"
-                raise Exception(error_message)
+        response = await _get_http().request(
+            method,
+            path,
+            headers={"Content-Type": content_type},
+            json=body if body and content_type == "application/json" else None,
+            content=body if content_type == "application/x-ndjson" else None
+        )
+        
+        # Store status for potential error reporting
+        status = response.status_code
+        
+        # Parse the response straight from the body bytes; decode it as text only if it isn't JSON
+        try:
+            response_data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            response_data = response.text
+        
+        # Check if response is OK (2xx status code)
+        if 200 <= status < 300:
+            return response_data
+        else:
+            error_message = f"Elasticsearch error: {status} - {response_data}"
+            raise Exception(error_message)
     except Exception as error:
         logger.error(f"Error making ELK request: {error}")
         raise error
@@ -331,45 +393,62 @@ def format_response(data: Any) -> str:
         data = data.model_dump()
     
     try:
-        return json.dumps(data, indent=2)
+        # Anything JSON has no type for (such as an exception) is rendered with str()
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
     except Exception as error:
         return f"Error formatting response: {str(error)}"
 
+# Build a request path with a query string of the parameters that are set
+def with_query(path: str, **params: Optional[str]) -> str:
+    query = urlencode({key: value for key, value in params.items() if value}, safe=",")
+    return f"{path}?{query}" if query else path
+
+# Validators for the parameter models, built on first use of each model
+_adapters: Dict[type, TypeAdapter] = {}
+
 # Decorator to validate function parameters using Pydantic models
 def validate_params(model_class):
     """Decorator to validate function parameters using a Pydantic model.
     
+    The tool receives its arguments as passed; the model only checks them.
+    
     Args:
         model_class: The Pydantic model class to use for validation
     """
     def decorator(func):
+        @functools.wraps(func)
         async def wrapper(*args, **kwargs):
+            adapter = _adapters.get(model_class)
+            if adapter is None:
+                adapter = _adapters[model_class] = TypeAdapter(model_class)
             try:
-                # Create model instance from kwargs
-                params = model_class(**kwargs)
-                # Update kwargs with validated values
-                kwargs.update(params.model_dump())
-                return await func(*args, **kwargs)
+                adapter.validate_python(kwargs)
             except ValidationError as error:
                 return f"Validation error: {error}"
+            return await func(*args, **kwargs)
         return wrapper
     return decorator
 
 # Check if we're running in serverless mode
 async def check_serverless_mode() -> bool:
     """Detect if the Elasticsearch instance is running in serverless mode"""
-    global is_serverless
+    global _serverless
     
-    if is_serverless is None:
-        try:
-            info = await make_elk_request("/")
-            is_serverless = info.get("version", {}).get("build_flavor") == "serverless"
-            logger.info(f"Detected Elasticsearch running in {'serverless' if is_serverless else 'standard'} mode")
-        except Exception as error:
-            logger.error(f"Error detecting serverless mode: {error}")
-            is_serverless = False
+    # Already detected: answer without touching the lock
+    if _serverless is not None:
+        return _serverless
     
-    return is_serverless
+    async with _serverless_lock:
+        if _serverless is None:
+            try:
+                info = await make_elk_request("/")
+                _serverless = info.get("version", {}).get("build_flavor") == "serverless"
+                logger.info(f"Detected Elasticsearch running in {'serverless' if _serverless else 'standard'} mode")
+            except Exception as error:
+                logger.error(f"Error detecting serverless mode: {error}")
+                _serverless = False
+    
+    return _serverless
 
 # =============================================================================
 # 1. Cluster APIs
@@ -395,21 +474,9 @@ async def cluster_health(
         if serverless:
             return "Cluster health API is not available in Elasticsearch Serverless mode"
             
-        path = "/_cluster/health"
-        
-        if index:
-            path += f"/{index}"
-        
-        query_params = []
-        if timeout:
-            query_params.append(f"timeout={timeout}")
-        if level:
-            query_params.append(f"level={level}")
+        path = f"/_cluster/health/{quote(index, safe='')}" if index else "/_cluster/health"
         
-        if query_params:
-            path += f"?{'&'.join(query_params)}"
-        
-        result = await make_elk_request(path)
+        result = await make_elk_request(with_query(path, timeout=timeout, level=level))
         
         return format_response(result)
     except Exception as error:
@@ -464,7 +531,7 @@ async def cluster_settings(
         if serverless:
             return "Cluster settings API is not available in Elasticsearch Serverless mode"
             
-        path = f"/_cluster/settings{'?include_defaults=true' if include_defaults else ''}"
+        path = with_query("/_cluster/settings", include_defaults="true" if include_defaults else None)
         
         if action == "get":
             result = await make_elk_request(path)
@@ -510,14 +577,12 @@ async def create_index(
         if settings:
             # In serverless mode, remove number_of_shards and number_of_replicas
             if serverless:
-                sanitized_settings = settings.copy()
-                if 'number_of_shards' in sanitized_settings:
-                    del sanitized_settings['number_of_shards']
-                    logger.info("Removed 'number_of_shards' setting for serverless mode")
-                if 'number_of_replicas' in sanitized_settings:
-                    del sanitized_settings['number_of_replicas']
-                    logger.info("Removed 'number_of_replicas' setting for serverless mode")
-                body["settings"] = sanitized_settings
+                dropped = settings.keys() & SERVERLESS_UNSUPPORTED_SETTINGS
+                if dropped:
+                    body["settings"] = {key: value for key, value in settings.items() if key not in dropped}
+                    logger.info("Removed %s settings for serverless mode", ", ".join(sorted(dropped)))
+                else:
+                    body["settings"] = settings
             else:
                 body["settings"] = settings
                 
@@ -638,16 +703,13 @@ async def index_document(
         refresh: Refresh policy ('true', 'false', 'wait_for')
     """
     try:
-        path = f"/{index_name}/_doc"
+        path = f"/{quote(index_name, safe='')}/_doc"
         method = "PUT" if id else "POST"
         
         if id:
-            path += f"/{id}"
-        
-        if refresh:
-            path += f"?refresh={refresh}"
+            path += f"/{quote(id, safe='')}"
         
-        result = await make_elk_request(path, method, document)
+        result = await make_elk_request(with_query(path, refresh=refresh), method, document)
         
         return format_response(result)
     except Exception as error:
@@ -670,18 +732,11 @@ async def get_document(
         source_excludes: Comma-separated list of fields to exclude from the source
     """
     try:
-        path = f"/{index_name}/_doc/{id}"
+        path = f"/{quote(index_name, safe='')}/_doc/{quote(id, safe='')}"
         
-        query_params = []
-        if source_includes:
-            query_params.append(f"_source_includes={source_includes}")
-        if source_excludes:
-            query_params.append(f"_source_excludes={source_excludes}")
-        
-        if query_params:
-            path += f"?{'&'.join(query_params)}"
-        
-        result = await make_elk_request(path)
+        result = await make_elk_request(
+            with_query(path, _source_includes=source_includes, _source_excludes=source_excludes)
+        )
         
         return format_response(result)
     except Exception as error:
@@ -702,12 +757,9 @@ async def delete_document(
         refresh: Refresh policy ('true', 'false', 'wait_for')
     """
     try:
-        path = f"/{index_name}/_doc/{id}"
+        path = f"/{quote(index_name, safe='')}/_doc/{quote(id, safe='')}"
         
-        if refresh:
-            path += f"?refresh={refresh}"
-        
-        result = await make_elk_request(path, "DELETE")
+        result = await make_elk_request(with_query(path, refresh=refresh), "DELETE")
         
         return format_response(result)
     except Exception as error:
@@ -728,12 +780,9 @@ async def bulk_operations(
         refresh: Refresh policy ('true', 'false', 'wait_for')
     """
     try:
-        path = f"/{index_name}/_bulk" if index_name else "/_bulk"
+        path = f"/{quote(index_name, safe='')}/_bulk" if index_name else "/_bulk"
         
-        if refresh:
-            path += f"?refresh={refresh}"
-        
-        result = await make_elk_request(path, "POST", operations, "application/x-ndjson")
+        result = await make_elk_request(with_query(path, refresh=refresh), "POST", operations, "application/x-ndjson")
         
         return format_response(result)
     except Exception as error:
@@ -871,13 +920,16 @@ async def multi_search(
     try:
         path = "/_msearch"
         
-        # Format the request according to ndjson format required by _msearch
-        ndjson_body = ""
+        # Format the request according to ndjson format required by _msearch,
+        # as bytes joined once so the body is never re-encoded or re-copied
+        lines = []
         for search in searches:
-            index = search.pop("index", None) if isinstance(search, dict) else None
+            index = search.get("index") if isinstance(search, dict) else None
             header = {"index": index} if index else {}
-            ndjson_body += json.dumps(header) + "\n"
-            ndjson_body += json.dumps(search) + "\n"
+            lines.append(orjson.dumps(header))
+            lines.append(orjson.dumps({key: value for key, value in search.items() if key != "index"}))
+        lines.append(b"")
+        ndjson_body = b"\n".join(lines)
         
         result = await make_elk_request(path, "POST", ndjson_body, "application/x-ndjson")
         
@@ -1085,8 +1137,8 @@ async def cluster_info() -> str:
         result = await make_elk_request("/")
         
         # Update our serverless detection while we're at it
-        global is_serverless
-        is_serverless = result.get("version", {}).get("build_flavor") == "serverless"
+        global _serverless
+        _serverless = result.get("version", {}).get("build_flavor") == "serverless"
         
         return format_response(result)
     except Exception as error:
@@ -1107,15 +1159,7 @@ async def cat_indices(
         headers: Comma-separated list of headers to include
     """
     try:
-        query_params = [f"format={format}"]
-        
-        if verbose:
-            query_params.append("v=true")
-        
-        if headers:
-            query_params.append(f"h={headers}")
-        
-        path = f"/_cat/indices?{'&'.join(query_params)}"
+        path = with_query("/_cat/indices", format=format, v="true" if verbose else None, h=headers)
         
         result = await make_elk_request(path)
         
@@ -1143,15 +1187,7 @@ async def cat_nodes(
         if serverless:
             return "Cat nodes API is not available in Elasticsearch Serverless mode"
             
-        query_params = [f"format={format}"]
-        
-        if verbose:
-            query_params.append("v=true")
-        
-        if headers:
-            query_params.append(f"h={headers}")
-        
-        path = f"/_cat/nodes?{'&'.join(query_params)}"
+        path = with_query("/_cat/nodes", format=format, v="true" if verbose else None, h=headers)
         
         result = await make_elk_request(path)
         
@@ -1174,12 +1210,7 @@ async def cat_aliases(
         verbose: Include column headers
     """
     try:
-        query_params = [f"format={format}"]
-        
-        if verbose:
-            query_params.append("v=true")
-        
-        path = f"/_cat/aliases?{'&'.join(query_params)}"
+        path = with_query("/_cat/aliases", format=format, v="true" if verbose else None)
         
         result = await make_elk_request(path)
         
@@ -1214,13 +1245,12 @@ async def create_index_template(
         serverless = await check_serverless_mode()
         
         if serverless and "settings" in template:
-            # Remove incompatible settings
-            if "number_of_shards" in template["settings"]:
-                del template["settings"]["number_of_shards"]
-                logger.info("Removed 'number_of_shards' from template settings for serverless mode")
-            if "number_of_replicas" in template["settings"]:
-                del template["settings"]["number_of_replicas"]
-                logger.info("Removed 'number_of_replicas' from template settings for serverless mode")
+            # Remove incompatible settings, in a new template so the caller's is left as passed
+            settings = template["settings"]
+            dropped = settings.keys() & SERVERLESS_UNSUPPORTED_SETTINGS
+            if dropped:
+                template = {**template, "settings": {key: value for key, value in settings.items() if key not in dropped}}
+                logger.info("Removed %s from template settings for serverless mode", ", ".join(sorted(dropped)))
                 
         path = f"/_index_template/{name}"
         
@@ -4,6 +4,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pytest
+import pytest_asyncio
 import os
 import json
 import asyncio
@@ -25,6 +26,12 @@ def event_loop():
     if not loop.is_closed():
         loop.close()
 
+@pytest_asyncio.fixture(autouse=True)
+async def consul_http_client():
+    """Close the shared client so each test's event loop gets fresh connections"""
+    yield
+    await consul_mcp.close_http_client()
+
 # Helper function to run tool functions and parse results
 async def run_tool(tool_func, **kwargs):
     """Run a tool function and parse its JSON result."""
@@ -142,6 +149,39 @@ class TestConsulMCPServer:
             except Exception as e:
                 print(f"Warning: Failed to deregister service: {str(e)}")
 
+    # 13 & 14. Test register_services_batch and deregister_services_batch
+    async def test_register_deregister_services_batch(self):
+        """Test registering and deregistering services in one transaction."""
+        nodes = await run_tool(consul_mcp.list_nodes)
+        assert len(nodes["nodes"]) > 0, "Need at least one node to register services"
+        
+        node_name = nodes["nodes"][0]["Node"]
+        service_ids = [f"test-batch-{os.getpid()}-{i}" for i in range(3)]
+        services = [
+            {"name": service_id, "id": service_id, "node": node_name, "port": 8080 + i, "tags": ["pytest"]}
+            for i, service_id in enumerate(service_ids)
+        ]
+        
+        try:
+            register_result = await run_tool(consul_mcp.register_services_batch, services=services)
+            if not register_result.get("success", False):
+                pytest.skip(f"Batch registration failed: {register_result.get('errors') or register_result.get('message')}")
+            assert len(register_result["results"]) == len(services), "Should return one result per service"
+            
+            registered = await run_tool(consul_mcp.list_services)
+            for service_id in service_ids:
+                assert service_id in registered, f"Service {service_id} should be in services list"
+        finally:
+            try:
+                deregister_result = await run_tool(
+                    consul_mcp.deregister_services_batch,
+                    services=[{"service_id": service_id, "node": node_name} for service_id in service_ids]
+                )
+                if not deregister_result.get("success", False):
+                    print(f"Warning: Batch deregistration failed: {deregister_result}")
+            except Exception as e:
+                print(f"Warning: Failed to deregister services: {str(e)}")
+
     # 6. Test health_service
     async def test_health_service(self):
         """Test health service checks."""
@@ -320,4 +360,44 @@ class TestConsulMCPServer:
                     assert isinstance(get_after_delete, dict) and "error" in get_after_delete, \
                         "All keys should be deleted"
             except Exception as e:
-                print(f"Warning: Failed to complete KV recursive deletion test: {str(e)}")
\ No newline at end of file
+                print(f"Warning: Failed to complete KV recursive deletion test: {str(e)}")
+
+    async def test_kv_get_many(self):
+        """Test reading several keys under a prefix in one call."""
+        test_prefix = f"pytest/many-{os.getpid()}/"
+        test_items = {f"{test_prefix}key1": "value1", f"{test_prefix}key2": "value2"}
+        
+        put_result = await run_tool(consul_mcp.kv_put, key=f"{test_prefix}key1", value="value1")
+        if not put_result.get("success", False):
+            if "Permission denied" in str(put_result.get("error", "")):
+                pytest.skip("Skipping KV get_many test due to permission denied")
+            else:
+                assert False, f"KV put failed: {put_result.get('error', 'unknown error')}"
+        
+        try:
+            put_result = await run_tool(consul_mcp.kv_put, key=f"{test_prefix}key2", value="value2")
+            assert put_result["success"], "KV put for key2 should succeed"
+            
+            # kv_put only takes text, so write the binary value directly
+            binary_key = f"{test_prefix}binary"
+            binary_value = b"\xff\xfe\x00\x01"
+            response = await consul_mcp._get_http().put(f"/v1/kv/{binary_key}", content=binary_value)
+            response.raise_for_status()
+            
+            missing_key = f"{test_prefix}missing"
+            result = await run_tool(
+                consul_mcp.kv_get_many,
+                prefix=test_prefix,
+                keys=[*test_items, binary_key, missing_key]
+            )
+            expected = {
+                **test_items,
+                binary_key: {"Value": base64.b64encode(binary_value).decode("ascii"), "_ValueEncoding": "base64"}
+            }
+            assert result["values"] == expected, "Should return text values decoded and binary values marked base64"
+            assert result["missing"] == [missing_key], "Should report keys that do not exist"
+        finally:
+            try:
+                await run_tool(consul_mcp.kv_delete, key=test_prefix, recurse=True)
+            except Exception as e:
+                print(f"Warning: Failed to clean up KV get_many test keys: {str(e)}")
@@ -7,11 +7,15 @@ import os
 import time
 import json
 import random
+import asyncio
+import pytest
+import pytest_asyncio
 from datetime import datetime, timedelta
 
 
 # Import the MCP server functions
 from servers.datadog.datadog_mcp import (
+    close_datadog_client,
     submit_metric,
     query_metrics,
     create_event,
@@ -20,11 +24,18 @@ from servers.datadog.datadog_mcp import (
     get_monitor,
     update_monitor,
     delete_monitor,
+    query_logs,
     create_dashboard,
     get_dashboard,
     delete_dashboard
 )
 
+@pytest_asyncio.fixture(autouse=True)
+async def datadog_client():
+    """Close the shared client so each test's event loop gets fresh connections"""
+    yield
+    await close_datadog_client()
+
 def print_result(name, result):
     """Print test result in a formatted way"""
     print(f"\n{'='*20} {name} {'='*20}")
@@ -37,7 +48,8 @@ def print_result(name, result):
         print(result)
     print(f"{'='*50}\n")
 
-def test_metrics():
+@pytest.mark.asyncio
+async def test_metrics():
     """Test metrics submission and querying"""
     print("\n🔍 Testing Metrics API...")
     
@@ -48,24 +60,25 @@ def test_metrics():
     tags = ["test:true", "env:dev", f"test_run:{timestamp}"]
     
     # Submit metric
-    result = submit_metric(metric_name, value, tags=tags)
+    result = await submit_metric(metric_name, value, tags=tags)
     print_result("Submit Metric", result)
     
     # Wait for metric to be available for querying
     print("Waiting 5 seconds for metric to be available...")
-    time.sleep(5)
+    await asyncio.sleep(5)
     
     # Query metrics
     from_time = timestamp - 60
     to_time = timestamp + 60
     query = f"{metric_name}{{{tags[0]}}}"
     
-    result = query_metrics(query, from_time, to_time)
+    result = await query_metrics(query, from_time, to_time)
     print_result("Query Metrics", result)
     
     return json.loads(result)
 
-def test_events():
+@pytest.mark.asyncio
+async def test_events():
     """Test events creation and retrieval"""
     print("\n🔍 Testing Events API...")
     
@@ -76,22 +89,23 @@ def test_events():
     tags = ["test:true", "env:dev", f"test_run:{timestamp}"]
     
     # Create event
-    result = create_event(title, text, tags=tags, alert_type="info", priority="normal")
+    result = await create_event(title, text, tags=tags, alert_type="info", priority="normal")
     print_result("Create Event", result)
     
     # Wait for event to be available
     print("Waiting 5 seconds for event to be available...")
-    time.sleep(5)
+    await asyncio.sleep(5)
     
     # Get events
     from_time = timestamp - 60
     to_time = timestamp + 60
-    result = get_events(query=f"tags:{tags[0]}", from_time=from_time, to_time=to_time)
+    result = await get_events(query=f"tags:{tags[0]}", from_time=from_time, to_time=to_time)
     print_result("Get Events", result)
     
     return json.loads(result)
 
-def test_monitors():
+@pytest.mark.asyncio
+async def test_monitors():
     """Test monitors creation, retrieval, update and deletion"""
     print("\n🔍 Testing Monitors API...")
     
@@ -103,7 +117,7 @@ def test_monitors():
     tags = ["test:true", "env:dev", f"test_run:{timestamp}"]
     
     # Create monitor
-    result = create_monitor(name, query, "metric alert", message, tags=tags)
+    result = await create_monitor(name, query, "metric alert", message, tags=tags)
     print_result("Create Monitor", result)
     
     try:
@@ -116,16 +130,16 @@ def test_monitors():
             return None
             
         # Get monitor
-        result = get_monitor(monitor_id)
+        result = await get_monitor(monitor_id)
         print_result("Get Monitor", result)
         
         # Update monitor
         new_name = f"Updated Test Monitor {timestamp}"
-        result = update_monitor(monitor_id, name=new_name)
+        result = await update_monitor(monitor_id, name=new_name)
         print_result("Update Monitor", result)
         
         # Delete monitor
-        result = delete_monitor(monitor_id)
+        result = await delete_monitor(monitor_id)
         print_result("Delete Monitor", result)
         
         return monitor_data
@@ -133,7 +147,25 @@ def test_monitors():
         print(f"❌ Error in monitor test: {e}")
         return None
 
-def test_dashboards():
+@pytest.mark.asyncio
+async def test_logs():
+    """Test paginated log search"""
+    print("\n🔍 Testing Logs API...")
+    
+    # Small search over the last hour
+    result = await query_logs("*", from_time="now-1h", to_time="now", limit=25)
+    print_result("Query Logs", result)
+    
+    logs_data = json.loads(result)
+    if "pages" not in logs_data:
+        return None
+    assert logs_data["count"] <= 25
+    assert sum(len(page) for page in logs_data["pages"]) == logs_data["count"]
+    
+    return logs_data
+
+@pytest.mark.asyncio
+async def test_dashboards():
     """Test dashboards creation, retrieval and deletion"""
     print("\n🔍 Testing Dashboards API...")
     
@@ -159,7 +191,7 @@ def test_dashboards():
     ]
     
     # Create dashboard
-    result = create_dashboard(title, description, widgets, "ordered")
+    result = await create_dashboard(title, description, widgets, "ordered")
     print_result("Create Dashboard", result)
     
     try:
@@ -172,11 +204,11 @@ def test_dashboards():
             return None
             
         # Get dashboard
-        result = get_dashboard(dashboard_id)
+        result = await get_dashboard(dashboard_id)
         print_result("Get Dashboard", result)
         
         # Delete dashboard
-        result = delete_dashboard(dashboard_id)
+        result = await delete_dashboard(dashboard_id)
         print_result("Delete Dashboard", result)
         
         return dashboard_data
@@ -184,7 +216,39 @@ def test_dashboards():
         print(f"❌ Error in dashboard test: {e}")
         return None
 
-def run_all_tests():
+@pytest.mark.asyncio
+async def test_dashboards_skip_validation():
+    """Test creating a dashboard from raw widget JSON"""
+    print("\n🔍 Testing Dashboards API without widget validation...")
+    
+    timestamp = int(time.time())
+    title = f"Test Raw Dashboard {timestamp}"
+    widgets = [
+        {
+            "definition": {
+                "type": "timeseries",
+                "requests": [{"q": "avg:system.load.1{*}", "display_type": "line"}],
+                "title": f"Load {i}"
+            }
+        }
+        for i in range(20)
+    ]
+    
+    result = await create_dashboard(title, "Raw widget dashboard", widgets, "ordered", skip_validation=True)
+    print_result("Create Dashboard (skip validation)", result)
+    
+    dashboard_data = json.loads(result)
+    dashboard_id = dashboard_data.get("id")
+    if not dashboard_id:
+        print("❌ Could not get dashboard ID from response")
+        return None
+    
+    result = await delete_dashboard(dashboard_id)
+    print_result("Delete Dashboard", result)
+    
+    return dashboard_data
+
+async def run_all_tests():
     """Run all tests and report results"""
     print("\n🚀 Starting comprehensive Datadog MCP server tests...")
     print(f"Time: {datetime.now().isoformat()}")
@@ -194,24 +258,32 @@ def run_all_tests():
     
     # Test metrics
     print("\n📊 TESTING METRICS...")
-    metrics_result = test_metrics()
+    metrics_result = await test_metrics()
     results["metrics"] = "✅ Success" if metrics_result else "❌ Failed"
     
     # Test events
     print("\n📅 TESTING EVENTS...")
-    events_result = test_events()
+    events_result = await test_events()
     results["events"] = "✅ Success" if events_result else "❌ Failed"
     
     # Test monitors
     print("\n🔔 TESTING MONITORS...")
-    monitors_result = test_monitors()
+    monitors_result = await test_monitors()
     results["monitors"] = "✅ Success" if monitors_result else "❌ Failed"
     
+    # Test logs
+    print("\n🪵 TESTING LOGS...")
+    logs_result = await test_logs()
+    results["logs"] = "✅ Success" if logs_result else "❌ Failed"
+    
     # Test dashboards
     print("\n📈 TESTING DASHBOARDS...")
-    dashboards_result = test_dashboards()
+    dashboards_result = await test_dashboards()
     results["dashboards"] = "✅ Success" if dashboards_result else "❌ Failed"
     
+    raw_dashboards_result = await test_dashboards_skip_validation()
+    results["raw dashboards"] = "✅ Success" if raw_dashboards_result else "❌ Failed"
+    
     # Print summary
     print("\n📋 TEST SUMMARY:")
     for test, result in results.items():
@@ -219,6 +291,7 @@ def run_all_tests():
     
     overall = "✅ ALL TESTS PASSED" if all(["Failed" not in r for r in results.values()]) else "❌ SOME TESTS FAILED"
     print(f"\n{overall}")
+    await close_datadog_client()
 
 if __name__ == "__main__":
-    run_all_tests()
+    asyncio.run(run_all_tests())
@@ -445,6 +445,21 @@ class TestVolumes:
         volumes = docker_client.volumes.list(filters={"name": volume_name})
         assert len(volumes.volumes) == 0
 
+# Overview Tests
+class TestOverview:
+    def test_describe_all(self):
+        """Test listing every resource type in one call."""
+        result = run_async(run_tool(docker_mcp.describe_all))
+        assert isinstance(result, str)
+        
+        # Parse the JSON result
+        overview = json.loads(result)
+        assert set(overview) == {"containers", "images", "networks", "volumes"}
+        
+        # The pulled test image and the default networks are always present
+        assert any(TEST_IMAGE in image["tags"] for image in overview["images"])
+        assert any(network["name"] == "bridge" for network in overview["networks"])
+
 # Integration Tests
 class TestIntegration:
     def test_container_with_volume_and_network(self):